@@ -4,14 +4,23 @@
 This module provides an asynchronous function for generating a random delay.
 
 It includes the `wait_random` function, which asynchronously waits for a
-random delay within a specified maximum duration.
+random delay within a specified maximum duration, its blocking counterpart
+`blocking_wait_random` with `offload_wait_random` to run it on an executor,
+and the `random_delays` function, which draws many such delays at once.
 """
 
 import asyncio
 import random
+import time
+from concurrent.futures import Executor
+from typing import List, Optional
 
+TimerWheel = __import__('5-timer_wheel').TimerWheel
 
-async def wait_random(max_delay: int = 10) -> float:
+
+async def wait_random(max_delay: int = 10,
+                      wheel: Optional[TimerWheel] = None,
+                      rng: Optional[random.Random] = None) -> float:
     """
     Asynchronously wait for a random delay between 0 and `max_delay` seconds.
 
@@ -20,6 +29,33 @@ async def wait_random(max_delay: int = 10) -> float:
     Although it doesn't actually include an `await` statement to simulate
     waiting, it can be used in an asynchronous context.
 
+    Parameters:
+    max_delay (int, optional): The maximum delay duration in seconds.
+    Defaults to 10.
+    wheel (TimerWheel, optional): A timer wheel to sleep on instead of
+    `asyncio.sleep`. Defaults to None.
+    rng (random.Random, optional): The generator to draw the delay from.
+    Defaults to None (the `random` module).
+
+    Returns:
+    float: The random delay duration generated.
+    """
+    delay = (random if rng is None else rng).uniform(0, max_delay)
+    if wheel is None:
+        await asyncio.sleep(delay)
+    else:
+        await wheel.sleep(delay)
+    return delay
+
+
+def blocking_wait_random(max_delay: int = 10) -> float:
+    """
+    Block the calling thread for a random delay between 0 and `max_delay`
+    seconds and return it.
+
+    This is the unit of work `offload_wait_random` runs on an executor; it
+    is a module-level function so that process pools can pickle it.
+
     Parameters:
     max_delay (int, optional): The maximum delay duration in seconds.
     Defaults to 10.
@@ -28,5 +64,47 @@ async def wait_random(max_delay: int = 10) -> float:
     float: The random delay duration generated.
     """
     delay = random.uniform(0, max_delay)
-    await asyncio.sleep(delay)
+    time.sleep(delay)
     return delay
+
+
+async def offload_wait_random(max_delay: int = 10,
+                              executor: Optional[Executor] = None) -> float:
+    """
+    Asynchronously run `blocking_wait_random` on `executor`.
+
+    Parameters:
+    max_delay (int, optional): The maximum delay duration in seconds.
+    Defaults to 10.
+    executor (Executor, optional): The thread or process pool to run on.
+    Defaults to None (the event loop's default thread pool).
+
+    Returns:
+    float: The random delay duration generated.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, blocking_wait_random,
+                                      max_delay)
+
+
+def random_delays(n: int, max_delay: int,
+                  rng: Optional[random.Random] = None) -> List[float]:
+    """
+    Draw `n` random delays between 0 and `max_delay` seconds, sorted.
+
+    All delays come from one pass over `rng`, so a seeded `random.Random`
+    gives the same delays on every run.
+
+    Parameters:
+    n (int): The number of delays to draw.
+    max_delay (int): The maximum delay duration in seconds.
+    rng (random.Random, optional): The generator to draw from.
+    Defaults to None (the `random` module).
+
+    Returns:
+    List[float]: The delays in ascending order.
+    """
+    draw = (random if rng is None else rng).random
+    delays = [max_delay * draw() for _ in range(n)]
+    delays.sort()
+    return delays
@@ -5,17 +5,271 @@ This module provides an asynchronous function that waits for multiple
 random delays.
 
 It includes the `wait_n` function, which asynchronously waits for `n` random
-delays and returns a list of these delays in the order they were completed.
+delays and returns a list of these delays in the order they were completed,
+and `iter_wait_n`, which yields the delays as they complete. With a timeout,
+`wait_n` returns a `PartialDelays` list of the delays that made it.
 """
 
 import asyncio
-from typing import List
+import random
+from concurrent.futures import Executor
+from typing import (Any, AsyncIterator, Callable, Dict, Iterable, List,
+                    Optional)
 
 
 wait_random = __import__('0-basic_async_syntax').wait_random
+offload_wait_random = __import__('0-basic_async_syntax').offload_wait_random
+random_delays = __import__('0-basic_async_syntax').random_delays
+CompletionQueue = __import__('9-completion_queue').CompletionQueue
+TimerWheel = __import__('5-timer_wheel').TimerWheel
+TaskEngine = __import__('10-task_engine').TaskEngine
 
 
-async def wait_n(n: int, max_delay: int) -> List[float]:
+class PartialDelays(list):
+    """
+    The delays that completed before a deadline.
+
+    `cancelled` holds the creation indices (sorted order for batched
+    delays) of the units that did not complete and were cancelled.
+    """
+
+    def __init__(self, delays: Iterable[float] = (),
+                 cancelled: Iterable[int] = ()) -> None:
+        """
+        Create the list from the completed `delays`.
+        """
+        super().__init__(delays)
+        self.cancelled = sorted(cancelled)
+
+
+def check_batched_options(**options: Any) -> None:
+    """
+    Raise `ValueError` if any of `options` is set, naming them; batched
+    delays create no tasks, so options about tasks cannot apply.
+    """
+    given = [name for name, value in options.items()
+             if value is not None and value is not False]
+    if given:
+        raise ValueError("batched cannot be combined with {}".format(
+            ", ".join(given)))
+
+
+async def iter_sorted_delays(n: int, max_delay: int,
+                             rng: Optional[random.Random] = None,
+                             wheel: Optional[TimerWheel] = None,
+                             timeout: Optional[float] = None,
+                             cancelled: Optional[List[int]] = None
+                             ) -> AsyncIterator[float]:
+    """
+    Asynchronously yield `n` pre-drawn random delays as they run out.
+
+    All delays are drawn and sorted up front with `random_delays`, and a
+    single coroutine sleeps from one deadline to the next, so there is one
+    pending timer instead of one task per delay. The delays come out in the
+    same ascending order the tasks of `iter_wait_n` complete in.
+
+    Parameters:
+    n (int): The number of delays.
+    max_delay (int): The maximum delay duration in seconds.
+    rng (random.Random, optional): The generator to draw from.
+    Defaults to None (the `random` module).
+    wheel (TimerWheel, optional): A timer wheel to sleep on instead of
+    `asyncio.sleep`. Defaults to None.
+    timeout (float, optional): Stop at the first delay longer than this.
+    Defaults to None.
+    cancelled (List[int], optional): Receives the sorted-order indices of
+    the delays dropped by `timeout`. Defaults to None.
+
+    Yields:
+    float: Each delay once it has elapsed since the call.
+    """
+    sleep = asyncio.sleep if wheel is None else wheel.sleep
+    loop = asyncio.get_event_loop()
+    start_time = loop.time()
+    for index, delay in enumerate(random_delays(n, max_delay, rng)):
+        if timeout is not None and delay > timeout:
+            if cancelled is not None:
+                cancelled.extend(range(index, n))
+            return
+        remaining = start_time + delay - loop.time()
+        if remaining > 0:
+            await sleep(remaining)
+        yield delay
+
+
+async def iter_completed(spawn: Callable[[], asyncio.Future], n: int,
+                         max_concurrency: Optional[int] = None,
+                         ordered: bool = False,
+                         timeout: Optional[float] = None,
+                         cancelled: Optional[List[int]] = None
+                         ) -> AsyncIterator:
+    """
+    Asynchronously yield the results of `n` futures made by `spawn`.
+
+    At most `max_concurrency` futures are in flight; a new one is spawned
+    each time one finishes. Results come in completion order, or in spawn
+    order with `ordered`, where results held back until the earlier ones
+    arrive also count against `max_concurrency`, so a slow unit stalls new
+    spawns instead of letting held results pile up. Unfinished futures are cancelled when `timeout`
+    runs out or the generator is closed early. Futures that finish at the
+    deadline are still yielded, and none are spawned after it.
+
+    Parameters:
+    spawn (Callable[[], asyncio.Future]): Starts one unit of work.
+    n (int): The number of units.
+    max_concurrency (int, optional): The maximum number of units in flight.
+    Defaults to None (all `n` at once).
+    ordered (bool, optional): Yield in spawn order. Defaults to False.
+    timeout (float, optional): Seconds after which to stop waiting; results
+    finished by then are still yielded. Defaults to None.
+    cancelled (List[int], optional): Receives the spawn indices of the units
+    that were cancelled or never spawned. Defaults to None.
+
+    Yields:
+    The result of each unit.
+    """
+    if max_concurrency is None:
+        max_concurrency = n
+    elif max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    loop = asyncio.get_event_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    queue = CompletionQueue()
+    indices: Dict[asyncio.Future, int] = {}
+    finished: Dict[int, object] = {}
+    ready: List[object] = []
+    spawned = 0
+    next_index = 0
+    try:
+        while True:
+            # results held for reordering count against max_concurrency
+            while (spawned < n
+                   and len(queue) + len(finished) < max_concurrency
+                   and (deadline is None or loop.time() < deadline)):
+                indices[queue.add(spawn())] = spawned
+                spawned += 1
+            for result in ready:
+                yield result
+            ready = []
+            if not queue:
+                break
+            try:
+                future = await queue.get(
+                    None if deadline is None else deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+            index = indices.pop(future)
+            if not ordered:
+                ready.append(future.result())
+                continue
+            finished[index] = future.result()
+            while next_index in finished:
+                ready.append(finished.pop(next_index))
+                next_index += 1
+        for index in sorted(finished):
+            yield finished.pop(index)
+    finally:
+        dropped = queue.cancel()
+        if cancelled is not None:
+            cancelled.extend(indices[future] for future in dropped)
+            cancelled.extend(range(spawned, n))
+
+
+async def iter_wait_n(n: int, max_delay: int,
+                      max_concurrency: Optional[int] = None,
+                      wheel: Optional[TimerWheel] = None,
+                      batched: bool = False,
+                      rng: Optional[random.Random] = None,
+                      executor: Optional[Executor] = None,
+                      ordered: bool = False,
+                      timeout: Optional[float] = None,
+                      cancelled: Optional[List[int]] = None,
+                      engine: Optional[TaskEngine] = None
+                      ) -> AsyncIterator[float]:
+    """
+    Asynchronously yield `n` random delays in the order they complete.
+
+    This is the streaming form of `wait_n`: each delay is yielded as soon as
+    its task finishes, so callers can act on the first completions. Tasks
+    that are still running when the generator is closed early (`aclose`, or
+    leaving an `async for` with `break` once the generator is finalized) are
+    cancelled.
+
+    Parameters:
+    n (int): The number of tasks to create.
+    max_delay (int): The maximum delay duration in seconds for each task.
+    max_concurrency (int, optional): The maximum number of tasks in flight.
+    Defaults to None (all `n` at once).
+    wheel (TimerWheel, optional): A timer wheel passed on to `wait_random`
+    to coalesce the sleeps. Defaults to None.
+    batched (bool, optional): Draw every delay up front and wait them out
+    in order with `iter_sorted_delays` instead of creating tasks.
+    Defaults to False.
+    rng (random.Random, optional): The generator to draw the delays
+    from. Defaults to None (the `random` module).
+    executor (Executor, optional): Run each unit as `blocking_wait_random`
+    on this thread or process pool instead of on the event loop.
+    Defaults to None.
+    ordered (bool, optional): Yield in creation order instead of
+    completion order. Defaults to False.
+    timeout (float, optional): Seconds after which the stragglers are
+    cancelled and the generator stops. Defaults to None.
+    cancelled (List[int], optional): Receives the indices of the units
+    cancelled by `timeout` or by closing early. Defaults to None.
+    engine (TaskEngine, optional): A running engine from `10-task_engine`
+    to spawn the tasks on. Defaults to None (bare `asyncio.create_task`).
+
+    Raises:
+    ValueError: If `batched` is combined with `max_concurrency`,
+    `executor`, `ordered` or `engine`, or `executor` with `wheel` or
+    `rng`.
+
+    Yields:
+    float: Each delay as its task completes.
+    """
+    if batched:
+        check_batched_options(max_concurrency=max_concurrency,
+                              executor=executor, ordered=ordered,
+                              engine=engine)
+    if executor is not None and wheel is not None:
+        raise ValueError("wheel cannot be combined with executor")
+    if executor is not None and rng is not None:
+        raise ValueError("rng cannot be combined with executor")
+    if batched:
+        async for delay in iter_sorted_delays(n, max_delay, rng, wheel,
+                                              timeout, cancelled):
+            yield delay
+        return
+
+    def spawn() -> asyncio.Future:
+        """Start one unit of work."""
+        if executor is None:
+            unit = wait_random(max_delay, wheel, rng)
+        else:
+            unit = offload_wait_random(max_delay, executor)
+        if engine is None:
+            return asyncio.create_task(unit)
+        return engine.spawn(unit)
+
+    delays = iter_completed(spawn, n, max_concurrency, ordered, timeout,
+                            cancelled)
+    try:
+        async for delay in delays:
+            yield delay
+    finally:
+        await delays.aclose()
+
+
+async def wait_n(n: int, max_delay: int,
+                 max_concurrency: Optional[int] = None,
+                 wheel: Optional[TimerWheel] = None,
+                 batched: bool = False,
+                 rng: Optional[random.Random] = None,
+                 executor: Optional[Executor] = None,
+                 ordered: bool = False,
+                 timeout: Optional[float] = None,
+                 engine: Optional[TaskEngine] = None) -> List[float]:
     """
     Asynchronously wait for `n` random delays and return the list of delays.
 
@@ -24,13 +278,39 @@ async def wait_n(n: int, max_delay: int) -> List[float]:
     The tasks are executed concurrently, and the function returns a list of
     delays in the order they are completed.
 
+    With `max_concurrency`, at most that many tasks exist at any time: a new
+    task is only created when a running one finishes, so memory stays
+    constant however large `n` is.
+
     Parameters:
     n (int): The number of tasks to create.
     max_delay (int): The maximum delay duration in seconds for each task.
+    max_concurrency (int, optional): The maximum number of tasks in flight.
+    Defaults to None (all `n` at once).
+    wheel (TimerWheel, optional): A timer wheel passed on to `wait_random`
+    to coalesce the sleeps. Defaults to None.
+    batched (bool, optional): Draw every delay up front in one sorted batch
+    and wait them out in order. Defaults to False.
+    rng (random.Random, optional): The generator to draw the delays
+    from. Defaults to None (the `random` module).
+    executor (Executor, optional): Run each unit as `blocking_wait_random`
+    on this thread or process pool; combine with `max_concurrency` to bound
+    how much work is queued on it. Defaults to None.
+    ordered (bool, optional): Return the delays in creation order instead
+    of completion order. Defaults to False.
+    timeout (float, optional): Seconds to wait at most. The delays that
+    completed by then are returned as a `PartialDelays` whose `cancelled`
+    lists the units cut off. Defaults to None.
+    engine (TaskEngine, optional): A running engine from `10-task_engine`
+    that owns the tasks. Defaults to None.
 
     Returns:
     List[float]: A list of delays in the order they were completed.
     """
-    tasks = [asyncio.create_task(wait_random(max_delay)) for _ in range(n)]
-    delays = [await task for task in asyncio.as_completed(tasks)]
-    return delays
+    cancelled: List[int] = []
+    delays = [delay async for delay in
+              iter_wait_n(n, max_delay, max_concurrency, wheel, batched, rng,
+                          executor, ordered, timeout, cancelled, engine)]
+    if timeout is None:
+        return delays
+    return PartialDelays(delays, cancelled)
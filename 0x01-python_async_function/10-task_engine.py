@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a structured execution engine for coroutines.
+
+It includes the `TaskEngine` class, which `wait_n`, `task_wait_random` and
+`task_wait_n` can spawn their tasks on. Every task belongs to the engine's
+`asyncio.TaskGroup` (or a compatible fallback before Python 3.11), so leaving
+`async with engine:` never leaks a task: a failure cancels the rest and the
+errors are raised together.
+"""
+
+import asyncio
+import heapq
+import itertools
+from typing import Any, Coroutine, List, Optional, Set, Tuple
+
+
+try:
+    TaskErrors = ExceptionGroup
+except NameError:
+    class TaskErrors(Exception):
+        """
+        The errors raised by the tasks of one `TaskEngine` run.
+        """
+
+        def __init__(self, message: str, exceptions: List[BaseException]):
+            """
+            Keep the task errors in `exceptions`.
+            """
+            super().__init__(message, exceptions)
+            self.message = message
+            self.exceptions = tuple(exceptions)
+
+
+class _FallbackTaskGroup:
+    """
+    The parts of `asyncio.TaskGroup` used by `TaskEngine`.
+
+    The first failing task cancels the others; leaving the group waits for
+    every task and raises their errors as one `TaskErrors`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty group.
+        """
+        self._tasks: Set[asyncio.Task] = set()
+        self._errors: List[BaseException] = []
+
+    async def __aenter__(self) -> "_FallbackTaskGroup":
+        """
+        Start the group.
+        """
+        return self
+
+    def create_task(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Create a task owned by the group.
+        """
+        if self._errors:
+            coro.close()
+            raise RuntimeError("task group is shutting down")
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """
+        Record a failure and cancel the other tasks.
+        """
+        self._tasks.discard(task)
+        if task.cancelled() or task.exception() is None:
+            return
+        self._errors.append(task.exception())
+        for other in self._tasks:
+            other.cancel()
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """
+        Wait for every task, cancelling them if the body failed.
+        """
+        if exc is not None:
+            for task in self._tasks:
+                task.cancel()
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+        if self._errors:
+            raise TaskErrors("unhandled errors in a TaskEngine",
+                             self._errors)
+
+
+class TaskEngine:
+    """
+    Run coroutines as tasks owned by one task group.
+
+    Use it with `async with engine:`; the engine can be entered again for
+    later runs. With `max_concurrency`, at most that many tasks run at once
+    and the others wait in a queue, the lowest `priority` first.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        """
+        Create an engine.
+
+        Parameters:
+        max_concurrency (int, optional): The maximum number of running
+        tasks. Defaults to None (no limit).
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._group: Any = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._queue: List[Tuple[int, int, Coroutine, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the engine is inside `async with`.
+        """
+        return self._group is not None
+
+    async def __aenter__(self) -> "TaskEngine":
+        """
+        Open a new task group for this run.
+        """
+        if self._group is not None:
+            raise RuntimeError("TaskEngine is already running")
+        if hasattr(asyncio, "TaskGroup"):
+            group = asyncio.TaskGroup()
+        else:
+            group = _FallbackTaskGroup()
+        await group.__aenter__()
+        self._group = group
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> Any:
+        """
+        Wait for every task of this run and raise their errors together.
+        """
+        try:
+            while self._queue and exc is None:
+                await asyncio.wait(set(self._tasks),
+                                   return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError as error:
+            # the group cancels its owner when a task fails
+            exc_type, exc, tb = type(error), error, error.__traceback__
+        try:
+            self._drop_queued()
+            return await self._group.__aexit__(exc_type, exc, tb)
+        finally:
+            self._drop_queued()
+            self._tasks = set()
+            self._group = None
+
+    def _drop_queued(self) -> None:
+        """
+        Discard the coroutines that never started.
+        """
+        for _, _, coro, future in self._queue:
+            coro.close()
+            future.cancel()
+        self._queue = []
+
+    def spawn(self, coro: Coroutine, priority: int = 0) -> asyncio.Future:
+        """
+        Run `coro` as a task of the current run.
+
+        Parameters:
+        coro (Coroutine): The coroutine to run.
+        priority (int, optional): Queue order when at `max_concurrency`;
+        lower values start first. Defaults to 0.
+
+        Returns:
+        asyncio.Future: The task, or a future for its result while queued.
+        """
+        if self._group is None:
+            coro.close()
+            raise RuntimeError("TaskEngine is not running; "
+                               "use `async with engine:`")
+        if (self.max_concurrency is None
+                or len(self._tasks) < self.max_concurrency):
+            return self._start(coro)
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._queue,
+                       (priority, next(self._counter), coro, future))
+        return future
+
+    def _start(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Create the task in the group and count it as running.
+        """
+        task = self._group.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """
+        Free a slot and start queued coroutines.
+        """
+        self._tasks.discard(task)
+        self._start_queued()
+
+    def _start_queued(self) -> None:
+        """
+        Start queued coroutines, by priority, while there are free slots.
+        """
+        while self._queue and len(self._tasks) < self.max_concurrency:
+            _, _, coro, future = heapq.heappop(self._queue)
+            if future.done():
+                coro.close()
+                continue
+            try:
+                task = self._start(coro)
+            except RuntimeError:
+                # the group is shutting down after a failure
+                coro.close()
+                future.cancel()
+                self._drop_queued()
+                return
+            _chain(task, future)
+
+
+def _chain(task: asyncio.Task, future: asyncio.Future) -> None:
+    """
+    Settle `future` like `task`, and cancel `task` if `future` is.
+    """
+    def copy(done: asyncio.Task) -> None:
+        """Copy the task's outcome to the future."""
+        if future.done():
+            return
+        if done.cancelled():
+            future.cancel()
+        elif done.exception() is not None:
+            future.set_exception(done.exception())
+        else:
+            future.set_result(done.result())
+
+    def cancel(done: asyncio.Future) -> None:
+        """Cancel the task along with the future."""
+        if done.cancelled():
+            task.cancel()
+
+    task.add_done_callback(copy)
+    future.add_done_callback(cancel)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a runner that shards `wait_n` across event loops.
+
+It includes the `run_sharded` function, which splits `n` tasks over several
+processes (or threads), runs each shard on its own event loop, and merges the
+delays of all shards into one list ordered by wall-clock finish time.
+"""
+
+import heapq
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+
+iter_wait_n = __import__('1-concurrent_coroutines').iter_wait_n
+event_loop_module = __import__('6-event_loop')
+
+
+def shard_sizes(n: int, shards: int) -> List[int]:
+    """
+    Split `n` tasks into `shards` sizes differing by at most one.
+    """
+    base, extra = divmod(n, shards)
+    return [base + (index < extra) for index in range(shards)]
+
+
+async def _finish_times(n: int, max_delay: int) -> List[Tuple[float, float]]:
+    """
+    Run `iter_wait_n` and stamp each delay with its wall-clock finish time.
+    """
+    return [(time.time(), delay) async for delay in iter_wait_n(n, max_delay)]
+
+
+def run_shard(n: int, max_delay: int, loop: Optional[str] = None,
+              seed: Optional[int] = None, reseed: bool = False) -> Dict:
+    """
+    Run one shard of `n` tasks on a new event loop.
+
+    Parameters:
+    n (int): The number of tasks in the shard.
+    max_delay (int): The maximum delay duration in seconds for each task.
+    loop (str, optional): The event loop name, as for `new_event_loop` in
+    `6-event_loop`. Defaults to None (plain asyncio).
+    seed (int, optional): The seed used when `reseed` is set.
+    reseed (bool, optional): Reseed `random` first, so forked processes do
+    not all draw the same delays. Defaults to False.
+
+    Returns:
+    Dict: The shard size, its start and end wall-clock times, and its
+    (finish time, delay) pairs in completion order.
+    """
+    if reseed:
+        random.seed(seed)
+    start_time = time.time()
+    finished = event_loop_module.run(_finish_times(n, max_delay), loop)
+    return {
+        "n": n,
+        "start": start_time,
+        "end": time.time(),
+        "finished": finished,
+    }
+
+
+def run_sharded(n: int, max_delay: int, shards: Optional[int] = None,
+                executor: str = "process", loop: Optional[str] = None,
+                seed: Optional[int] = None) -> Tuple[List[float], List[Dict]]:
+    """
+    Run `n` tasks of `wait_n` split across `shards` event loops.
+
+    Parameters:
+    n (int): The total number of tasks.
+    max_delay (int): The maximum delay duration in seconds for each task.
+    shards (int, optional): The number of shards. Defaults to None (the
+    CPU count).
+    executor (str, optional): "process" for one process per shard or
+    "thread" for one thread per shard. Defaults to "process".
+    loop (str, optional): The event loop name for every shard.
+    Defaults to None (plain asyncio).
+    seed (int, optional): With processes, shard `i` seeds `random` with
+    `seed + i`. Defaults to None (fresh entropy per shard).
+
+    Returns:
+    Tuple[List[float], List[Dict]]: Every delay ordered by finish time, and
+    the `run_shard` report of each shard without its delays.
+    """
+    shards = shards or os.cpu_count() or 1
+    if executor == "process":
+        pool = ProcessPoolExecutor
+        reseed = True
+    elif executor == "thread":
+        pool = ThreadPoolExecutor
+        reseed = False
+    else:
+        raise ValueError("unknown executor: {}".format(executor))
+
+    sizes = shard_sizes(n, shards)
+    seeds = [None if seed is None else seed + index
+             for index in range(shards)]
+    with pool(shards) as workers:
+        reports = list(workers.map(run_shard, sizes, [max_delay] * shards,
+                                   [loop] * shards, seeds,
+                                   [reseed] * shards))
+
+    delays = [delay for _, delay in
+              heapq.merge(*(report.pop("finished") for report in reports))]
+    return delays, reports
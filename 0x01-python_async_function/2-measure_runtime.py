@@ -6,17 +6,28 @@ time of asynchronous tasks.
 
 It includes the `measure_time` function, which measures the total execution
 time of running `n` asynchronous tasks with `wait_n`, and
-returns the average time per task.
+returns the average time per task, and the `benchmark` function, which
+repeats that measurement on a reused event loop and reports its statistics.
 """
 
+import json
+import math
+import random
+import statistics
 import time
 import asyncio
+from typing import Dict, Iterable, List, Optional
 
 
 wait_n = __import__('1-concurrent_coroutines').wait_n
+event_loop_module = __import__('6-event_loop')
+CompletionQueue = __import__('9-completion_queue').CompletionQueue
+sharded_runner = __import__('11-sharded_runner')
 
 
-def measure_time(n: int, max_delay: int) -> float:
+def measure_time(n: int, max_delay: int,
+                 loop: event_loop_module.LoopSpec = None,
+                 shards: Optional[int] = None) -> float:
     """
     Measure the average execution time for running `n` asynchronous tasks
     with `wait_n`.
@@ -28,13 +39,255 @@ def measure_time(n: int, max_delay: int) -> float:
     Parameters:
     n (int): The number of asynchronous tasks to run.
     max_delay (int): The maximum delay duration in seconds for each task.
+    loop (optional): The event loop to run on, as for `new_event_loop` in
+    `6-event_loop`, timed on that loop's clock (so "virtual" measures
+    virtual time). Defaults to None (`asyncio.run`).
+    shards (int, optional): Split the tasks over this many processes, each
+    with its own event loop, as `measure_sharded` does. Defaults to None.
 
     Returns:
     float: The average execution time per task
     """
+    if shards is not None:
+        return measure_sharded(n, max_delay, shards, loop=loop)["per_task"]
+
+    if loop is not None:
+        _, execution_time = event_loop_module.run_timed(
+            wait_n(n, max_delay), loop)
+        return execution_time / n
+
     start_time = time.perf_counter()
     asyncio.run(wait_n(n, max_delay))
     end_time = time.perf_counter()
 
     execution_time = end_time - start_time
     return execution_time / n
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """
+    Return the `q` percentile (0-100) of sorted values, interpolating
+    linearly between the closest ranks.
+    """
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    weight = position - lower
+    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+
+
+def benchmark(n: int, max_delay: int, trials: int = 10, warmup: int = 1,
+              seed: Optional[int] = None,
+              json_path: Optional[str] = None,
+              loop: event_loop_module.LoopSpec = None) -> Dict:
+    """
+    Benchmark the average execution time per task of `wait_n`.
+
+    Unlike `measure_time`, every run shares one event loop, so loop startup
+    is left out, the `warmup` runs are discarded, and the random delays are
+    drawn from a `random.Random(seed)` of their own, so that runs can be
+    compared with each other and the `random` module is left alone. Runs
+    are timed on the event loop's clock.
+
+    Parameters:
+    n (int): The number of asynchronous tasks per run.
+    max_delay (int): The maximum delay duration in seconds for each task.
+    trials (int, optional): The number of measured runs. Defaults to 10.
+    warmup (int, optional): The number of discarded runs. Defaults to 1.
+    seed (int, optional): The seed for the random delays. Defaults to None.
+    json_path (str, optional): A file to write the report to as JSON.
+    Defaults to None.
+    loop (optional): The event loop to run on, as for `new_event_loop` in
+    `6-event_loop`. Defaults to None (plain asyncio).
+
+    Returns:
+    Dict: The parameters, the per-task time of every trial, and their
+    mean, median, stdev, p95 and p99, in seconds.
+    """
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    rng = random.Random(seed)
+    event_loop = event_loop_module.new_event_loop(loop)
+    try:
+        for _ in range(warmup):
+            event_loop.run_until_complete(wait_n(n, max_delay, rng=rng))
+
+        samples = []
+        for _ in range(trials):
+            start_time = event_loop.time()
+            event_loop.run_until_complete(wait_n(n, max_delay, rng=rng))
+            samples.append((event_loop.time() - start_time) / n)
+        event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+    finally:
+        event_loop.close()
+
+    ordered = sorted(samples)
+    report = {
+        "n": n,
+        "max_delay": max_delay,
+        "trials": trials,
+        "warmup": warmup,
+        "seed": seed,
+        "loop": loop if loop is None or isinstance(loop, str) else repr(loop),
+        "samples": samples,
+        "mean": statistics.mean(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if trials > 1 else 0.0,
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+    }
+    if json_path is not None:
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def compare_loops(n: int, max_delay: int,
+                  loops: Optional[Iterable[str]] = None,
+                  **kwargs) -> Dict[str, Dict]:
+    """
+    Run `benchmark` on several event loops.
+
+    Parameters:
+    n (int): The number of asynchronous tasks per run.
+    max_delay (int): The maximum delay duration in seconds for each task.
+    loops (Iterable[str], optional): The event loop names to compare.
+    Defaults to None (every loop from `available_loops`).
+    **kwargs: Passed on to `benchmark`.
+
+    Returns:
+    Dict[str, Dict]: The `benchmark` report of each event loop by name.
+    """
+    if loops is None:
+        loops = event_loop_module.available_loops()
+    return {name: benchmark(n, max_delay, loop=name, **kwargs)
+            for name in loops}
+
+
+async def _drain_as_completed(n: int) -> float:
+    """
+    Collect `n` zero-delay tasks with `asyncio.as_completed` and return
+    the seconds spent collecting, leaving out task creation.
+    """
+    tasks = [asyncio.ensure_future(asyncio.sleep(0)) for _ in range(n)]
+    start_time = time.perf_counter()
+    for task in asyncio.as_completed(tasks):
+        await task
+    return time.perf_counter() - start_time
+
+
+async def _drain_completion_queue(n: int) -> float:
+    """
+    Collect `n` zero-delay tasks with a `CompletionQueue` and return the
+    seconds spent collecting, leaving out task creation.
+    """
+    tasks = [asyncio.ensure_future(asyncio.sleep(0)) for _ in range(n)]
+    start_time = time.perf_counter()
+    queue = CompletionQueue()
+    for task in tasks:
+        queue.add(task)
+    async for task in queue:
+        task.result()
+    return time.perf_counter() - start_time
+
+
+def completion_overhead(ns: Iterable[int] = (10 ** 3, 10 ** 4, 10 ** 5),
+                        trials: int = 10, warmup: int = 1,
+                        loop: event_loop_module.LoopSpec = None
+                        ) -> Dict[int, Dict[str, Dict]]:
+    """
+    Measure the per-task cost of collecting completions.
+
+    Like `benchmark`, every run shares one event loop and the `warmup`
+    runs are discarded. The tasks are created before the clock starts, so
+    each trial times only their collection with `asyncio.as_completed` or
+    with `CompletionQueue`. The two approaches alternate within a trial,
+    so drift in the machine's speed affects both alike.
+
+    Parameters:
+    ns (Iterable[int], optional): The task counts to measure.
+    Defaults to 10^3 up to 10^5.
+    trials (int, optional): The number of measured runs per approach.
+    Defaults to 10.
+    warmup (int, optional): The number of discarded runs. Defaults to 1.
+    loop (optional): The event loop to run on, as for `new_event_loop` in
+    `6-event_loop`. Defaults to None (plain asyncio).
+
+    Returns:
+    Dict[int, Dict[str, Dict]]: For each task count, the seconds per task
+    of "as_completed" and "completion_queue": every trial, and their
+    mean, median and stdev.
+    """
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    drains = {
+        "as_completed": _drain_as_completed,
+        "completion_queue": _drain_completion_queue,
+    }
+    report: Dict[int, Dict[str, Dict]] = {}
+    event_loop = event_loop_module.new_event_loop(loop)
+    try:
+        for n in ns:
+            samples: Dict[str, List[float]] = {name: [] for name in drains}
+            for trial in range(warmup + trials):
+                for name, drain in drains.items():
+                    elapsed = event_loop.run_until_complete(drain(n))
+                    if trial >= warmup:
+                        samples[name].append(elapsed / n)
+            report[n] = {
+                name: {
+                    "samples": values,
+                    "mean": statistics.mean(values),
+                    "median": statistics.median(values),
+                    "stdev": statistics.stdev(values) if trials > 1 else 0.0,
+                }
+                for name, values in samples.items()
+            }
+    finally:
+        event_loop.close()
+    return report
+
+
+def measure_sharded(n: int, max_delay: int, shards: Optional[int] = None,
+                    executor: str = "process",
+                    loop: Optional[str] = None) -> Dict:
+    """
+    Measure `wait_n` split across several event loops by `run_sharded`.
+
+    Parameters:
+    n (int): The total number of tasks.
+    max_delay (int): The maximum delay duration in seconds for each task.
+    shards (int, optional): The number of shards. Defaults to None (the
+    CPU count).
+    executor (str, optional): "process" or "thread". Defaults to "process".
+    loop (str, optional): The event loop name for every shard.
+    Defaults to None (plain asyncio).
+
+    Returns:
+    Dict: The wall time, the time per task and the throughput in tasks per
+    second overall, plus the size, elapsed time and throughput of each
+    shard.
+    """
+    start_time = time.perf_counter()
+    delays, reports = sharded_runner.run_sharded(n, max_delay, shards,
+                                                 executor, loop)
+    elapsed = time.perf_counter() - start_time
+
+    per_shard = []
+    for report in reports:
+        shard_elapsed = report["end"] - report["start"]
+        per_shard.append({
+            "n": report["n"],
+            "elapsed": shard_elapsed,
+            "throughput": report["n"] / shard_elapsed if shard_elapsed else 0,
+        })
+    return {
+        "n": len(delays),
+        "shards": len(reports),
+        "elapsed": elapsed,
+        "per_task": elapsed / n,
+        "throughput": n / elapsed,
+        "per_shard": per_shard,
+    }
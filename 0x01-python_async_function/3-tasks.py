@@ -5,12 +5,46 @@ Import wait_random from 0-basic_async_syntax.
 """
 
 import asyncio
+from concurrent.futures import Executor
+from typing import Awaitable, Optional
 
 wait_random = __import__("0-basic_async_syntax").wait_random
+offload_wait_random = __import__("0-basic_async_syntax").offload_wait_random
+TaskStats = __import__("7-task_stats").TaskStats
+TaskEngine = __import__("10-task_engine").TaskEngine
 
 
-def task_wait_random(max_delay: int) -> asyncio.Task:
+async def timed_wait_random(delay: Awaitable[float], stats: TaskStats,
+                            queued: float) -> float:
     """
-    This function returns an asyncio.Task object
+    Await a wait_random coroutine and record its timings in `stats`
     """
-    return asyncio.create_task(wait_random(max_delay))
+    loop = asyncio.get_event_loop()
+    started = loop.time()
+    result = await delay
+    stats.record(result, queued, started, loop.time())
+    return result
+
+
+def task_wait_random(max_delay: int, stats: Optional[TaskStats] = None,
+                     executor: Optional[Executor] = None,
+                     engine: Optional[TaskEngine] = None) -> asyncio.Future:
+    """
+    This function returns an asyncio.Task object (or a future, see below)
+
+    When a `TaskStats` is given as `stats`, the task records its queue,
+    start and wake-up times in it. With an `executor`, the delay is a
+    blocking sleep run on that thread or process pool. With a running
+    `TaskEngine` as `engine`, the task is spawned on (and owned by) it; a
+    queued spawn returns a future instead of the task.
+    """
+    if executor is None:
+        delay = wait_random(max_delay)
+    else:
+        delay = offload_wait_random(max_delay, executor)
+    if stats is not None:
+        queued = asyncio.get_event_loop().time()
+        delay = timed_wait_random(delay, stats, queued)
+    if engine is None:
+        return asyncio.create_task(delay)
+    return engine.spawn(delay)
@@ -7,18 +7,89 @@ Take the code from wait_n and alter it into a new function task_wait_n. The
 code is nearly identical to wait_n except task_wait_random is being called.
 """
 
-from typing import List
-import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterator, List, Optional
+import random
 
 
 task_wait_random = __import__("3-tasks").task_wait_random
+iter_sorted_delays = __import__("1-concurrent_coroutines").iter_sorted_delays
+iter_completed = __import__("1-concurrent_coroutines").iter_completed
+PartialDelays = __import__("1-concurrent_coroutines").PartialDelays
+TaskStats = __import__("7-task_stats").TaskStats
+TaskEngine = __import__("10-task_engine").TaskEngine
+check_batched_options = __import__(
+    "1-concurrent_coroutines").check_batched_options
 
 
-async def task_wait_n(n: int, max_delay: int) -> List[float]:
+async def iter_task_wait_n(n: int, max_delay: int,
+                           stats: Optional[TaskStats] = None,
+                           batched: bool = False,
+                           rng: Optional[random.Random] = None,
+                           executor: Optional[Executor] = None,
+                           max_concurrency: Optional[int] = None,
+                           ordered: bool = False,
+                           timeout: Optional[float] = None,
+                           cancelled: Optional[List[int]] = None,
+                           engine: Optional[TaskEngine] = None
+                           ) -> AsyncIterator[float]:
+    """
+    Asynchronously yield the delays of `n` tasks in the order they
+    complete, cancelling the unfinished ones if the generator is closed
+    early. Timings are recorded in `stats` when it is given.
+
+    With `batched`, the delays are drawn up front from `rng` and waited
+    out in order by `iter_sorted_delays` instead, without tasks, so
+    `stats`, `executor`, `max_concurrency`, `ordered` and `engine` raise
+    `ValueError` with it. `executor`, `max_concurrency`, `ordered`,
+    `timeout`, `cancelled` and `engine` work as for `iter_wait_n`.
+    """
+    if batched:
+        check_batched_options(stats=stats, executor=executor,
+                              max_concurrency=max_concurrency,
+                              ordered=ordered, engine=engine)
+        async for delay in iter_sorted_delays(n, max_delay, rng, None,
+                                              timeout, cancelled):
+            yield delay
+        return
+
+    def spawn():
+        """Start one task."""
+        return task_wait_random(max_delay, stats, executor, engine)
+
+    delays = iter_completed(spawn, n, max_concurrency, ordered, timeout,
+                            cancelled)
+    try:
+        async for delay in delays:
+            yield delay
+    finally:
+        await delays.aclose()
+
+
+async def task_wait_n(n: int, max_delay: int,
+                      stats: Optional[TaskStats] = None,
+                      batched: bool = False,
+                      rng: Optional[random.Random] = None,
+                      executor: Optional[Executor] = None,
+                      max_concurrency: Optional[int] = None,
+                      ordered: bool = False,
+                      timeout: Optional[float] = None,
+                      engine: Optional[TaskEngine] = None) -> List[float]:
     """
     Asynchronously wait for `n` tasks and return the list of
     delays in the order they complete.
+
+    Pass a `TaskStats` from `7-task_stats` as `stats` to read the
+    scheduling timings of the tasks after the call. With a `timeout`, the
+    delays completed in time come back as a `PartialDelays` listing the
+    cancelled tasks. The other options are passed on to `iter_task_wait_n`.
     """
 
-    delays = [task_wait_random(max_delay) for _ in range(n)]
-    return [await delay for delay in asyncio.as_completed(delays)]
+    cancelled: List[int] = []
+    delays = [delay async for delay in
+              iter_task_wait_n(n, max_delay, stats, batched, rng, executor,
+                               max_concurrency, ordered, timeout, cancelled,
+                               engine)]
+    if timeout is None:
+        return delays
+    return PartialDelays(delays, cancelled)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a bucketed timer wheel for coalescing many sleeps.
+
+It includes the `TimerWheel` class, whose `sleep` method can stand in for
+`asyncio.sleep` in `wait_random` and `wait_n`. Every sleep ending in the same
+`resolution`-wide slot shares a single event loop timer, so hundreds of
+thousands of concurrent waits cost one scheduler entry per slot instead of
+one per coroutine.
+"""
+
+import asyncio
+import itertools
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class TimerWheel:
+    """
+    Coalesce sleeps into one event loop wakeup per time slot.
+
+    Sleeps end at the close of their slot, so a sleep may last up to
+    `resolution` seconds longer than asked. Within a slot, sleepers are woken
+    in deadline order. A wheel serves one event loop at a time.
+    """
+
+    def __init__(self, resolution: float = 0.01) -> None:
+        """
+        Create a timer wheel.
+
+        Parameters:
+        resolution (float, optional): The slot width in seconds.
+        Defaults to 0.01.
+        """
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self.resolution = resolution
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Dict[int, List[Tuple[float, int, asyncio.Future]]] = {}
+        self._counter = itertools.count()
+
+    async def sleep(self, delay: float) -> None:
+        """
+        Asynchronously wait until the slot holding `now + delay` fires.
+
+        Parameters:
+        delay (float): The minimum delay duration in seconds.
+        """
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = {}
+
+        deadline = loop.time() + delay
+        slot = math.ceil(deadline / self.resolution)
+        waiters = self._slots.get(slot)
+        if waiters is None:
+            waiters = self._slots[slot] = []
+            loop.call_at(slot * self.resolution, self._fire, slot)
+
+        future = loop.create_future()
+        waiters.append((deadline, next(self._counter), future))
+        await future
+
+    def _fire(self, slot: int) -> None:
+        """
+        Wake every sleeper of `slot` in deadline order.
+        """
+        waiters = self._slots.pop(slot, [])
+        waiters.sort()
+        for _, _, future in waiters:
+            if not future.done():
+                future.set_result(None)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+This module provides an event loop selection layer.
+
+It includes the `new_event_loop` function, which builds an event loop from a
+name ("asyncio", "uvloop", "virtual"), an event loop policy or a factory, and
+the `run` function, which runs a coroutine such as `wait_n(...)`,
+`task_wait_n(...)` or `async_comprehension()` to completion on such a loop.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Union
+
+
+def _uvloop() -> asyncio.AbstractEventLoop:
+    """
+    Create a uvloop event loop, importing uvloop only when asked for.
+    """
+    import uvloop
+    return uvloop.new_event_loop()
+
+
+def _virtual() -> asyncio.AbstractEventLoop:
+    """
+    Create a virtual time event loop from `8-virtual_time`.
+    """
+    return __import__('8-virtual_time').VirtualTimeEventLoop()
+
+
+LOOP_FACTORIES: Dict[str, Callable[[], asyncio.AbstractEventLoop]] = {
+    "asyncio": asyncio.new_event_loop,
+    "uvloop": _uvloop,
+    "virtual": _virtual,
+}
+
+LoopSpec = Union[None, str, asyncio.AbstractEventLoopPolicy,
+                 Callable[[], asyncio.AbstractEventLoop]]
+
+
+def new_event_loop(loop: LoopSpec = None) -> asyncio.AbstractEventLoop:
+    """
+    Create a new event loop.
+
+    Parameters:
+    loop (optional): A name from `LOOP_FACTORIES`, an event loop policy, or
+    a callable returning an event loop. Defaults to None (plain asyncio).
+
+    Returns:
+    asyncio.AbstractEventLoop: The new event loop.
+    """
+    if loop is None:
+        return asyncio.new_event_loop()
+    if isinstance(loop, str):
+        try:
+            factory = LOOP_FACTORIES[loop]
+        except KeyError:
+            raise ValueError("unknown event loop: {}".format(loop)) from None
+        return factory()
+    if isinstance(loop, asyncio.AbstractEventLoopPolicy):
+        return loop.new_event_loop()
+    return loop()
+
+
+def available_loops() -> List[str]:
+    """
+    List the names in `LOOP_FACTORIES` whose event loop can be created here.
+    """
+    names = []
+    for name in LOOP_FACTORIES:
+        try:
+            new_event_loop(name).close()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def run(main: Awaitable, loop: LoopSpec = None) -> Any:
+    """
+    Run `main` to completion on a new event loop and close the loop.
+
+    Parameters:
+    main (Awaitable): The coroutine to run.
+    loop (optional): The event loop to use, as for `new_event_loop`.
+
+    Returns:
+    Any: The result of `main`.
+    """
+    event_loop = new_event_loop(loop)
+    try:
+        asyncio.set_event_loop(event_loop)
+        result = event_loop.run_until_complete(main)
+        event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+        return result
+    finally:
+        asyncio.set_event_loop(None)
+        event_loop.close()
+
+
+async def _timed(main: Awaitable) -> Tuple[Any, float]:
+    """
+    Await `main` and return its result with the elapsed loop time.
+    """
+    loop = asyncio.get_event_loop()
+    start_time = loop.time()
+    result = await main
+    return result, loop.time() - start_time
+
+
+def run_timed(main: Awaitable, loop: LoopSpec = None) -> Tuple[Any, float]:
+    """
+    Run `main` like `run` and time it on the event loop's own clock, which
+    keeps the timing meaningful on a virtual time loop.
+
+    Returns:
+    Tuple[Any, float]: The result of `main` and its duration in seconds.
+    """
+    return run(_timed(main), loop)
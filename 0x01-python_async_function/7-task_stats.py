@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+"""
+This module provides opt-in scheduling instrumentation for tasks.
+
+It includes the `TaskStats` class, which `task_wait_random` and `task_wait_n`
+fill in when given one, and the `Histogram` class it aggregates into. Per
+task it records the requested delay, when the task was queued, when it
+started running and when it woke up, so that queue-to-start latency and
+wake-up lag show when the event loop is saturated.
+"""
+
+import bisect
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+
+class TaskTiming(NamedTuple):
+    """
+    Event loop times of one instrumented task.
+    """
+    requested: float
+    queued: float
+    started: float
+    woke: float
+
+    @property
+    def queue_latency(self) -> float:
+        """Seconds between creating the task and its first step."""
+        return self.started - self.queued
+
+    @property
+    def wake_lag(self) -> float:
+        """Seconds the task woke up after its requested delay ran out."""
+        return self.woke - self.started - self.requested
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of non-negative durations in seconds.
+
+    The default buckets double from one microsecond up to about 17 minutes;
+    values past the last bound fall in an overflow bucket.
+    """
+
+    DEFAULT_BOUNDS = tuple(1e-6 * 2 ** k for k in range(31))
+
+    def __init__(self, bounds: Optional[Sequence[float]] = None) -> None:
+        """
+        Create an empty histogram with the given upper bucket bounds.
+        """
+        self.bounds = tuple(self.DEFAULT_BOUNDS if bounds is None
+                            else sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Count `value` in its bucket.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        """
+        Return the mean of the counted values.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the upper bound of the bucket holding the `q` percentile
+        (0-100), or the maximum if it is in the overflow bucket.
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the count, mean, p50, p95, p99 and max of the histogram.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class TaskStats:
+    """
+    Collect the scheduling timings of instrumented tasks.
+
+    `timings` keeps every `TaskTiming`, `queue_latency` and `wake_lag` are
+    histograms over them, and `total_lag` adds up how late the loop woke
+    the tasks.
+    """
+
+    def __init__(self, keep_timings: bool = True) -> None:
+        """
+        Create an empty collector. With `keep_timings` False only the
+        histograms are kept, so memory stays constant.
+        """
+        self.keep_timings = keep_timings
+        self.timings: List[TaskTiming] = []
+        self.queue_latency = Histogram()
+        self.wake_lag = Histogram()
+        self.total_lag = 0.0
+
+    def record(self, requested: float, queued: float, started: float,
+               woke: float) -> None:
+        """
+        Record the event loop times of one task.
+        """
+        timing = TaskTiming(requested, queued, started, woke)
+        if self.keep_timings:
+            self.timings.append(timing)
+        lag = max(0.0, timing.wake_lag)
+        self.queue_latency.add(timing.queue_latency)
+        self.wake_lag.add(lag)
+        self.total_lag += lag
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Return the histogram summaries and the total lag.
+        """
+        return {
+            "queue_latency": self.queue_latency.summary(),
+            "wake_lag": self.wake_lag.summary(),
+            "total_lag": self.total_lag,
+        }
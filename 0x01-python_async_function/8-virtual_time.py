@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""
+This module provides an event loop running on a virtual clock.
+
+It includes the `VirtualTimeEventLoop` class. Whenever the loop would block
+waiting for its next timer, it moves its clock forward to that timer
+instead, so `wait_random`, `wait_n` and `measure_time` finish instantly
+while every sleep still ends in the same order and reports the same delay.
+"""
+
+import asyncio
+import selectors
+from typing import Any, List, Mapping, Optional, Tuple
+
+
+class _VirtualSelector(selectors.BaseSelector):
+    """
+    Selector that advances a virtual clock instead of blocking on a timeout.
+
+    Ready I/O is always served first; without any timer (`timeout` None)
+    it blocks on real I/O, as a loop waiting for another thread would.
+    """
+
+    def __init__(self, loop: "VirtualTimeEventLoop") -> None:
+        """Wrap the platform's default selector for `loop`."""
+        self._selector = selectors.DefaultSelector()
+        self._loop = loop
+
+    def register(self, fileobj: Any, events: int,
+                 data: Any = None) -> selectors.SelectorKey:
+        """Register a file object with the wrapped selector."""
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj: Any) -> selectors.SelectorKey:
+        """Unregister a file object from the wrapped selector."""
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj: Any, events: int,
+               data: Any = None) -> selectors.SelectorKey:
+        """Change the events watched for a file object."""
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: Optional[float] = None
+               ) -> List[Tuple[selectors.SelectorKey, int]]:
+        """Poll ready I/O, advancing the clock by `timeout` if none."""
+        events = self._selector.select(0)
+        if events or timeout is not None and timeout <= 0:
+            return events
+        if timeout is None:
+            return self._selector.select(None)
+        self._loop.advance(timeout)
+        return []
+
+    def get_map(self) -> Mapping[Any, selectors.SelectorKey]:
+        """Return the wrapped selector's key map."""
+        return self._selector.get_map()
+
+    def close(self) -> None:
+        """Close the wrapped selector."""
+        self._selector.close()
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop whose `time` only moves when every task is waiting on a timer.
+
+    The clock starts at 0 and jumps straight to the next due timer, so an
+    `asyncio.sleep(10)` returns at once with `loop.time()` 10 seconds later.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a virtual time event loop with its clock at 0.
+        """
+        self._virtual_time = 0.0
+        super().__init__(_VirtualSelector(self))
+
+    def time(self) -> float:
+        """
+        Return the virtual time in seconds.
+        """
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the virtual clock forward by `seconds`.
+        """
+        self._virtual_time += seconds
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a lightweight completion queue for futures.
+
+It includes the `CompletionQueue` class, which `wait_n` and `task_wait_n` use
+in place of `asyncio.as_completed`. Each added future gets one done callback
+that appends it to a deque, and a single waiter future wakes the consumer,
+so there are no per-task wrapper futures or timeouts.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional, Set
+
+
+class CompletionQueue:
+    """
+    Hand out added futures in the order they finish.
+
+    `get` (or `async for`) returns the next finished future; iteration
+    stops once every added future has been handed out. Futures may be added
+    while iterating, which is how bounded fan-outs refill themselves.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty completion queue.
+        """
+        self._pending: Set[asyncio.Future] = set()
+        self._done: Deque[asyncio.Future] = deque()
+        self._waiter: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        """
+        Return the number of added futures not handed out yet.
+        """
+        return len(self._pending) + len(self._done)
+
+    def add(self, future: asyncio.Future) -> asyncio.Future:
+        """
+        Track `future` and return it.
+        """
+        self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: asyncio.Future) -> None:
+        """
+        Queue a finished future and wake the consumer.
+        """
+        if future not in self._pending:
+            # already queued by `_collect`
+            return
+        self._pending.remove(future)
+        self._done.append(future)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self, timeout: Optional[float] = None) -> asyncio.Future:
+        """
+        Asynchronously wait for and return the next finished future.
+
+        Parameters:
+        timeout (float, optional): The longest to wait, in seconds.
+        Defaults to None (no limit).
+
+        A future that finished by the deadline is returned even if its
+        done callback has not run yet, so nothing finishing exactly at the
+        deadline is lost; with `timeout` 0 or less, `get` hands out the
+        finished futures and then raises.
+
+        Raises:
+        IndexError: If no added future is left.
+        asyncio.TimeoutError: If no future finished within `timeout`.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not self._done:
+            if not self._pending:
+                raise IndexError("get from an empty completion queue")
+            self._waiter = loop.create_future()
+            try:
+                if deadline is None:
+                    await self._waiter
+                else:
+                    await asyncio.wait_for(self._waiter,
+                                           deadline - loop.time())
+            except asyncio.TimeoutError:
+                if not self._collect():
+                    raise
+            finally:
+                self._waiter = None
+        return self._done.popleft()
+
+    def _collect(self) -> bool:
+        """
+        Queue the pending futures that are done but whose callbacks have
+        not run yet, and return whether any finished future is queued.
+        """
+        for future in [f for f in self._pending if f.done()]:
+            self._pending.remove(future)
+            self._done.append(future)
+        return bool(self._done)
+
+    def __aiter__(self) -> "CompletionQueue":
+        """
+        Iterate over finished futures.
+        """
+        return self
+
+    async def __anext__(self) -> asyncio.Future:
+        """
+        Return the next finished future, or stop when none is left.
+        """
+        if not self:
+            raise StopAsyncIteration
+        return await self.get()
+
+    def cancel(self) -> List[asyncio.Future]:
+        """
+        Cancel every future that has not finished yet and return them.
+        """
+        return [future for future in list(self._pending) if future.cancel()]
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the CompletionQueue Class
+
+This module provides a set of unit tests for the `CompletionQueue` class
+from the `9-completion_queue` module, which `wait_n` uses instead of
+`asyncio.as_completed`, and for the `completion_overhead` benchmark from
+`2-measure_runtime`. The tests run on the virtual time event loop from
+`8-virtual_time`, so timeouts are exact.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+
+CompletionQueue = __import__('9-completion_queue').CompletionQueue
+event_loop_module = __import__('6-event_loop')
+wait_n = __import__('1-concurrent_coroutines').wait_n
+completion_overhead = __import__('2-measure_runtime').completion_overhead
+
+
+def run_virtual(main):
+    """
+    Run `main` on a virtual time event loop and return its result.
+    """
+    return event_loop_module.run(main, "virtual")
+
+
+class TestCompletionQueue(unittest.TestCase):
+    """
+    Unit tests for the `CompletionQueue` class.
+    """
+
+    def test_completion_order(self):
+        """
+        Test that futures come out in the order they finish, whatever the
+        order they were added in.
+        """
+        async def main():
+            queue = CompletionQueue()
+            for delay in (3, 1, 2):
+                queue.add(asyncio.ensure_future(asyncio.sleep(delay, delay)))
+            self.assertEqual(len(queue), 3)
+            results = [future.result() async for future in queue]
+            self.assertEqual(len(queue), 0)
+            return results
+
+        self.assertEqual(run_virtual(main()), [1, 2, 3])
+
+    def test_add_while_iterating(self):
+        """
+        Test that futures added during iteration are handed out too, as
+        a bounded fan-out refilling itself does.
+        """
+        async def main():
+            queue = CompletionQueue()
+            queue.add(asyncio.ensure_future(asyncio.sleep(1, 0)))
+            results = []
+            async for future in queue:
+                results.append(future.result())
+                if len(results) < 5:
+                    queue.add(asyncio.ensure_future(
+                        asyncio.sleep(1, len(results))))
+            return results
+
+        self.assertEqual(run_virtual(main()), [0, 1, 2, 3, 4])
+
+    def test_failed_and_cancelled(self):
+        """
+        Test that failed and cancelled futures are handed out like the
+        others, to be inspected by the caller.
+        """
+        async def fail():
+            raise KeyError("unit")
+
+        async def main():
+            queue = CompletionQueue()
+            failed = queue.add(asyncio.ensure_future(fail()))
+            stopped = queue.add(asyncio.ensure_future(asyncio.sleep(5)))
+            stopped.cancel()
+            return {await queue.get(), await queue.get()}, failed, stopped
+
+        handed, failed, stopped = run_virtual(main())
+        self.assertEqual(handed, {failed, stopped})
+        self.assertIsInstance(failed.exception(), KeyError)
+        self.assertTrue(stopped.cancelled())
+
+    @parameterized.expand([
+        ("no_timeout", None),
+        ("timeout", 1),
+    ])
+    def test_empty(self, _, timeout):
+        """
+        Test that `get` on an empty queue raises `IndexError`.
+        """
+        async def main():
+            with self.assertRaises(IndexError):
+                await CompletionQueue().get(timeout)
+
+        run_virtual(main())
+
+    def test_timeout_prefers_finished(self):
+        """
+        Test that futures finishing exactly at the timeout are handed out
+        instead of a timeout, and that `get` then times out.
+        """
+        async def main():
+            queue = CompletionQueue()
+            for value in range(3):
+                queue.add(asyncio.ensure_future(asyncio.sleep(1, value)))
+            later = queue.add(asyncio.ensure_future(asyncio.sleep(2)))
+            results = [(await queue.get(1)).result() for _ in range(3)]
+            with self.assertRaises(asyncio.TimeoutError):
+                await queue.get(0)
+            self.assertEqual(queue.cancel(), [later])
+            return sorted(results)
+
+        self.assertEqual(run_virtual(main()), [0, 1, 2])
+
+    def test_wait_n_uses_queue(self):
+        """
+        Test that `wait_n` no longer goes through `asyncio.as_completed`.
+        """
+        with patch("asyncio.as_completed") as as_completed:
+            delays = run_virtual(wait_n(10, 10))
+        as_completed.assert_not_called()
+        self.assertEqual(delays, sorted(delays))
+
+
+class TestCompletionOverhead(unittest.TestCase):
+    """
+    Unit tests for the `completion_overhead` benchmark.
+    """
+
+    def test_report(self):
+        """
+        Test that both approaches are measured for every task count.
+        """
+        report = completion_overhead((10, 100), trials=2, warmup=0)
+        self.assertEqual(list(report), [10, 100])
+        for approaches in report.values():
+            self.assertEqual(set(approaches),
+                             {"as_completed", "completion_queue"})
+            for stats in approaches.values():
+                self.assertEqual(len(stats["samples"]), 2)
+                self.assertGreater(stats["mean"], 0)
+
+    def test_trials(self):
+        """
+        Test that at least one trial is required.
+        """
+        with self.assertRaises(ValueError):
+            completion_overhead((10,), trials=0)
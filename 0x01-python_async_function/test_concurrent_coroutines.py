@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for wait_n and iter_wait_n
+
+This module provides a set of unit tests for the `wait_n`, `iter_wait_n`
+and `iter_completed` functions from the `1-concurrent_coroutines` module
+and their `task_wait_n` counterparts from `4-tasks`. The tests run on the virtual time event loop from `8-virtual_time`, so
+delays of several seconds finish at once and their timing is exact.
+"""
+
+import asyncio
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from parameterized import parameterized
+
+concurrent_coroutines = __import__('1-concurrent_coroutines')
+event_loop_module = __import__('6-event_loop')
+PartialDelays = concurrent_coroutines.PartialDelays
+iter_completed = concurrent_coroutines.iter_completed
+TimerWheel = __import__('5-timer_wheel').TimerWheel
+tasks = __import__('4-tasks')
+wait_n = concurrent_coroutines.wait_n
+random_delays = __import__('0-basic_async_syntax').random_delays
+TaskStats = __import__('7-task_stats').TaskStats
+
+
+def run_virtual(main):
+    """
+    Run `main` on a virtual time event loop and return its result.
+    """
+    return event_loop_module.run(main, "virtual")
+
+
+def sleeper(delay, result=None):
+    """
+    Return a `spawn` callable starting `asyncio.sleep(delay, result)`.
+    """
+    return lambda: asyncio.ensure_future(asyncio.sleep(delay, result))
+
+
+class TestBounded(unittest.TestCase):
+    """
+    Unit tests for `max_concurrency`.
+    """
+
+    def setUp(self):
+        """
+        Count the `wait_random` coroutines running at once.
+        """
+        self.running = 0
+        self.peak = 0
+        original = concurrent_coroutines.wait_random
+
+        async def counted(*args):
+            """Run the real `wait_random`, counting it while it runs."""
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            try:
+                return await original(*args)
+            finally:
+                self.running -= 1
+
+        patcher = patch.object(concurrent_coroutines, "wait_random", counted)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @parameterized.expand([
+        ("one", 1),
+        ("some", 8),
+        ("more_than_n", 500),
+    ])
+    def test_at_most_k_in_flight(self, _, max_concurrency):
+        """
+        Test that no more than `max_concurrency` units run at once, that
+        the pool is kept full, and that every delay comes back.
+        """
+        delays = run_virtual(wait_n(200, 10, max_concurrency))
+        self.assertEqual(len(delays), 200)
+        self.assertEqual(self.peak, min(max_concurrency, 200))
+        self.assertEqual(self.running, 0)
+
+    def test_completion_order(self):
+        """
+        Test that a pool of one returns the delays in creation order, and a
+        larger pool in the order they finish.
+        """
+        random.seed(31)
+        serial = run_virtual(wait_n(20, 10, 1))
+        random.seed(31)
+        self.assertEqual(serial, [random.uniform(0, 10) for _ in range(20)])
+        random.seed(31)
+        self.assertEqual(run_virtual(wait_n(20, 10, 20)), sorted(serial))
+
+    def test_task_wait_n(self):
+        """
+        Test that `task_wait_n` keeps the same bound.
+        """
+        started = []
+        original = tasks.task_wait_random
+
+        def spawn(*args):
+            """Start the real task, recording how many were unfinished."""
+            started.append(sum(not task.done() for task in spawned))
+            spawned.append(original(*args))
+            return spawned[-1]
+
+        spawned = []
+        with patch.object(tasks, "task_wait_random", spawn):
+            delays = run_virtual(tasks.task_wait_n(50, 10,
+                                                   max_concurrency=3))
+        self.assertEqual(len(delays), 50)
+        self.assertEqual(max(started), 2)
+
+    def test_invalid(self):
+        """
+        Test that `max_concurrency` must be at least 1.
+        """
+        with self.assertRaises(ValueError):
+            run_virtual(wait_n(5, 10, 0))
+
+
+class TestStreaming(unittest.TestCase):
+    """
+    Unit tests for `iter_wait_n` and `iter_task_wait_n`.
+    """
+
+    STREAMS = [
+        ("iter_wait_n", concurrent_coroutines.iter_wait_n),
+        ("iter_task_wait_n", tasks.iter_task_wait_n),
+    ]
+
+    @parameterized.expand(STREAMS)
+    def test_yields_on_completion(self, _, stream):
+        """
+        Test that each delay is yielded the moment it elapses.
+        """
+        async def main():
+            loop = asyncio.get_event_loop()
+            start_time = loop.time()
+            return [(delay, loop.time() - start_time)
+                    async for delay in stream(30, 10)]
+
+        pairs = run_virtual(main())
+        self.assertEqual(len(pairs), 30)
+        for delay, elapsed in pairs:
+            self.assertAlmostEqual(delay, elapsed)
+
+    @parameterized.expand(STREAMS)
+    def test_early_close_cancels_the_rest(self, _, stream):
+        """
+        Test that closing the stream early cancels every unfinished task.
+        """
+        async def main():
+            cancelled = []
+            delays = stream(10, 10, cancelled=cancelled)
+            first = [await delays.__anext__() for _ in range(3)]
+            await delays.aclose()
+            await asyncio.sleep(0)
+            pending = len(asyncio.all_tasks()) - 1
+            return first, cancelled, pending
+
+        first, cancelled, pending = run_virtual(main())
+        self.assertEqual(first, sorted(first))
+        self.assertEqual(len(cancelled), 7)
+        self.assertEqual(pending, 0)
+
+
+class TestBatched(unittest.TestCase):
+    """
+    Unit tests for `batched` delays.
+    """
+
+    @parameterized.expand([
+        ("wait_n", wait_n),
+        ("task_wait_n", tasks.task_wait_n),
+    ])
+    def test_seeded_sorted_delays(self, _, collect):
+        """
+        Test that batched delays are the sorted draws of the seeded
+        generator, with no task created for them.
+        """
+        counts = []
+
+        async def main():
+            delays = collect(200, 10, batched=True, rng=random.Random(38))
+            gather = asyncio.ensure_future(delays)
+            while not gather.done():
+                counts.append(len(asyncio.all_tasks()))
+                await asyncio.sleep(0.5)
+            return gather.result()
+
+        delays = run_virtual(main())
+        self.assertEqual(delays, random_delays(200, 10, random.Random(38)))
+        self.assertEqual(max(counts), 2)
+
+    def test_yields_at_deadlines(self):
+        """
+        Test that each batched delay is yielded once it has elapsed.
+        """
+        async def main():
+            loop = asyncio.get_event_loop()
+            return [(delay, loop.time()) async for delay in
+                    concurrent_coroutines.iter_wait_n(
+                        50, 10, batched=True, rng=random.Random(38))]
+
+        for delay, elapsed in run_virtual(main()):
+            self.assertAlmostEqual(delay, elapsed)
+
+    def test_stats_rejected(self):
+        """
+        Test that `task_wait_n` rejects `stats` with batched delays, which
+        create no tasks to instrument.
+        """
+        with self.assertRaises(ValueError):
+            run_virtual(tasks.task_wait_n(3, 1, TaskStats(), batched=True))
+
+
+class TestTimeout(unittest.TestCase):
+    """
+    Unit tests for `timeout` and `PartialDelays`.
+    """
+
+    def setUp(self):
+        """
+        Seed the delays of `wait_random`.
+        """
+        random.seed(41)
+
+    @parameterized.expand([
+        ("tasks", {}),
+        ("bounded", {"max_concurrency": 4}),
+        ("ordered", {"ordered": True}),
+        ("batched", {"batched": True}),
+    ])
+    def test_partial_delays(self, _, options):
+        """
+        Test that a timeout returns the delays finished in time and lists
+        every other unit as cancelled.
+        """
+        delays = run_virtual(wait_n(20, 10, timeout=5, **options))
+        self.assertIsInstance(delays, PartialDelays)
+        self.assertTrue(all(delay <= 5 for delay in delays))
+        self.assertEqual(len(delays) + len(delays.cancelled), 20)
+        self.assertEqual(len(set(delays.cancelled)), len(delays.cancelled))
+
+    def test_without_timeout(self):
+        """
+        Test that without a timeout a plain list comes back.
+        """
+        delays = run_virtual(wait_n(5, 10))
+        self.assertIs(type(delays), list)
+        self.assertEqual(len(delays), 5)
+
+    @parameterized.expand([
+        ("all_at_once", None, 1000, 0),
+        ("bounded", 10, 10, 990),
+    ])
+    def test_completion_at_deadline(self, _, max_concurrency, done, dropped):
+        """
+        Test that units finishing exactly at the deadline are yielded, and
+        that no unit is spawned after it.
+        """
+        async def main():
+            cancelled = []
+            results = [result async for result in iter_completed(
+                sleeper(0.05, 1.0), 1000, max_concurrency, timeout=0.05,
+                cancelled=cancelled)]
+            return results, cancelled
+
+        results, cancelled = run_virtual(main())
+        self.assertEqual(len(results), done)
+        self.assertEqual(sorted(cancelled), list(range(done, done + dropped)))
+
+    def test_late_units_cancelled(self):
+        """
+        Test that units still running at the deadline are cancelled and
+        reported by spawn index.
+        """
+        delays = iter([0.01, 0.2, 0.02, 0.3])
+        futures = []
+
+        def spawn():
+            """Start the next unit and keep it."""
+            futures.append(asyncio.ensure_future(
+                asyncio.sleep(next(delays), "done")))
+            return futures[-1]
+
+        async def main():
+            cancelled = []
+            results = [result async for result in iter_completed(
+                spawn, 4, timeout=0.1, cancelled=cancelled)]
+            return results, cancelled
+
+        results, cancelled = run_virtual(main())
+        self.assertEqual(results, ["done", "done"])
+        self.assertEqual(sorted(cancelled), [1, 3])
+        self.assertTrue(all(futures[index].cancelled() for index in (1, 3)))
+
+
+class TestOrdered(unittest.TestCase):
+    """
+    Unit tests for `ordered` results.
+    """
+
+    def test_ordered(self):
+        """
+        Test that `ordered` returns the delays in creation order.
+        """
+        random.seed(40)
+        delays = run_virtual(wait_n(50, 10, ordered=True))
+        random.seed(40)
+        expected = [random.uniform(0, 10) for _ in range(50)]
+        self.assertEqual(delays, expected)
+
+    @parameterized.expand([
+        ("ordered", True),
+        ("completion_order", False),
+    ])
+    def test_slow_first_unit_bounded(self, _, ordered):
+        """
+        Test that results held back behind a slow first unit count against
+        `max_concurrency`, so no more than twice that many units are ever
+        spawned but not yet yielded.
+        """
+        spawned = []
+
+        def spawn():
+            """Start a slow first unit, then quick ones."""
+            delay = 10 if not spawned else 0.001
+            spawned.append(len(spawned))
+            return asyncio.ensure_future(asyncio.sleep(delay, spawned[-1]))
+
+        async def main():
+            results = []
+            peak = 0
+            async for result in iter_completed(spawn, 1000, 2, ordered):
+                peak = max(peak, len(spawned) - len(results))
+                results.append(result)
+            return peak, results
+
+        peak, results = run_virtual(main())
+        self.assertLessEqual(peak, 4)
+        self.assertEqual(sorted(results), list(range(1000)))
+        if ordered:
+            self.assertEqual(results, list(range(1000)))
+
+
+class TestExecutor(unittest.TestCase):
+    """
+    Unit tests for running the delays on an executor.
+    """
+
+    def test_executor(self):
+        """
+        Test that every unit runs on the executor.
+        """
+        offload = concurrent_coroutines.offload_wait_random
+        with ThreadPoolExecutor(2) as pool, patch.object(
+                concurrent_coroutines, "offload_wait_random",
+                wraps=offload) as mock_offload:
+            delays = asyncio.run(wait_n(6, 0, max_concurrency=2,
+                                        executor=pool))
+        self.assertEqual(delays, [0] * 6)
+        self.assertEqual(mock_offload.call_count, 6)
+        mock_offload.assert_called_with(0, pool)
+
+    @parameterized.expand([
+        ("batched_executor", {"batched": True, "executor": True}),
+        ("batched_bounded", {"batched": True, "max_concurrency": 2}),
+        ("batched_ordered", {"batched": True, "ordered": True}),
+        ("executor_wheel", {"executor": True, "wheel": True}),
+        ("executor_rng", {"executor": True, "rng": random.Random(1)}),
+    ])
+    def test_ignored_options_rejected(self, _, options):
+        """
+        Test that options the chosen mode would ignore raise `ValueError`.
+        """
+        with ThreadPoolExecutor(1) as pool:
+            if options.get("executor"):
+                options["executor"] = pool
+            if options.get("wheel"):
+                options["wheel"] = TimerWheel()
+            with self.assertRaises(ValueError):
+                asyncio.run(wait_n(3, 1, **options))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Event Loop Selection Layer
+
+This module provides a set of unit tests for the `new_event_loop`,
+`available_loops`, `run` and `run_timed` functions from the `6-event_loop`
+module, and for the `loop` option of `measure_time` and `compare_loops`
+from `2-measure_runtime`.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+
+event_loop_module = __import__('6-event_loop')
+measure_runtime = __import__('2-measure_runtime')
+VirtualTimeEventLoop = __import__('8-virtual_time').VirtualTimeEventLoop
+
+
+class TestNewEventLoop(unittest.TestCase):
+    """
+    Unit tests for the `new_event_loop` and `available_loops` functions.
+    """
+
+    @parameterized.expand([
+        ("default", None, asyncio.AbstractEventLoop),
+        ("asyncio", "asyncio", asyncio.AbstractEventLoop),
+        ("virtual", "virtual", VirtualTimeEventLoop),
+        ("policy", asyncio.DefaultEventLoopPolicy(),
+         asyncio.AbstractEventLoop),
+        ("factory", VirtualTimeEventLoop, VirtualTimeEventLoop),
+    ])
+    def test_specs(self, _, spec, expected):
+        """
+        Test each way of naming an event loop.
+        """
+        loop = event_loop_module.new_event_loop(spec)
+        try:
+            self.assertIsInstance(loop, expected)
+        finally:
+            loop.close()
+
+    def test_unknown_name(self):
+        """
+        Test that an unknown name raises `ValueError`.
+        """
+        with self.assertRaises(ValueError):
+            event_loop_module.new_event_loop("tokio")
+
+    def test_available_loops(self):
+        """
+        Test that loops whose module is missing are left out.
+        """
+        def missing():
+            raise ImportError("uvloop")
+
+        with patch.dict(event_loop_module.LOOP_FACTORIES,
+                        {"uvloop": missing}):
+            self.assertEqual(event_loop_module.available_loops(),
+                             ["asyncio", "virtual"])
+
+
+class TestRun(unittest.TestCase):
+    """
+    Unit tests for the `run` and `run_timed` functions.
+    """
+
+    def test_run_closes_loop(self):
+        """
+        Test that `run` returns the result, runs on the chosen loop and
+        closes it.
+        """
+        async def main():
+            return asyncio.get_event_loop()
+
+        loop = event_loop_module.run(main(), "virtual")
+        self.assertIsInstance(loop, VirtualTimeEventLoop)
+        self.assertTrue(loop.is_closed())
+
+    def test_run_timed(self):
+        """
+        Test that `run_timed` times on the loop's own clock.
+        """
+        result, elapsed = event_loop_module.run_timed(
+            asyncio.sleep(42, "done"), "virtual")
+        self.assertEqual(result, "done")
+        self.assertEqual(elapsed, 42)
+
+    def test_measure_time(self):
+        """
+        Test that `measure_time` on a loop reports that loop's time per
+        task.
+        """
+        per_task = measure_runtime.measure_time(10, 10, loop="virtual")
+        self.assertGreater(per_task, 0)
+        self.assertLessEqual(per_task, 10 / 10)
+
+    def test_compare_loops(self):
+        """
+        Test that `compare_loops` benchmarks each named loop.
+        """
+        reports = measure_runtime.compare_loops(5, 1, ["virtual"], trials=2,
+                                                seed=35)
+        self.assertEqual(list(reports), ["virtual"])
+        self.assertEqual(len(reports["virtual"]["samples"]), 2)
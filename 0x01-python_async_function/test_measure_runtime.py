@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Benchmark Harness
+
+This module provides a set of unit tests for the `benchmark` function from
+the `2-measure_runtime` module. The benchmarks run on the virtual time
+event loop from `8-virtual_time`, so a run takes as long as its longest
+delay in virtual time and no time at all for the test.
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+
+benchmark = __import__('2-measure_runtime').benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Unit tests for the `benchmark` function.
+    """
+
+    def test_seeded_runs_repeat(self):
+        """
+        Test that the same seed gives the same samples.
+        """
+        first = benchmark(20, 10, trials=3, seed=34, loop="virtual")
+        second = benchmark(20, 10, trials=3, seed=34, loop="virtual")
+        self.assertEqual(first["samples"], second["samples"])
+        self.assertEqual(len(first["samples"]), 3)
+        self.assertTrue(all(0 < sample <= 10 / 20
+                            for sample in first["samples"]))
+
+    def test_global_random_untouched(self):
+        """
+        Test that neither a seed nor the default leaves the `random` module
+        reseeded or advanced.
+        """
+        for seed in (34, None):
+            random.seed(7)
+            expected = random.random()
+            random.seed(7)
+            benchmark(5, 10, trials=2, seed=seed, loop="virtual")
+            self.assertEqual(random.random(), expected)
+
+    def test_report(self):
+        """
+        Test the statistics of the report and its JSON copy.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            report = benchmark(10, 10, trials=4, warmup=0, seed=1,
+                               json_path=path, loop="virtual")
+            with open(path) as f:
+                self.assertEqual(json.load(f), report)
+        samples = sorted(report["samples"])
+        self.assertEqual(report["loop"], "virtual")
+        self.assertAlmostEqual(report["median"],
+                               (samples[1] + samples[2]) / 2)
+        self.assertLessEqual(samples[0], report["p95"])
+        self.assertLessEqual(report["p95"], samples[-1])
+
+    def test_trials(self):
+        """
+        Test that at least one trial is required.
+        """
+        with self.assertRaises(ValueError):
+            benchmark(1, 1, trials=0)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Sharded Runner
+
+This module provides a set of unit tests for the `shard_sizes`,
+`run_shard` and `run_sharded` functions from the `11-sharded_runner`
+module and for `measure_sharded` from `2-measure_runtime`. The shards run
+on the virtual time event loop from `8-virtual_time`, so they finish at
+once whatever the delays.
+"""
+
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+
+sharded_runner = __import__('11-sharded_runner')
+measure_runtime = __import__('2-measure_runtime')
+
+
+class TestShardSizes(unittest.TestCase):
+    """
+    Unit tests for the `shard_sizes` function.
+    """
+
+    @parameterized.expand([
+        (10, 3, [4, 3, 3]),
+        (9, 3, [3, 3, 3]),
+        (2, 4, [1, 1, 0, 0]),
+    ])
+    def test_shard_sizes(self, n, shards, expected):
+        """
+        Test that the sizes add up to `n` and differ by at most one.
+        """
+        self.assertEqual(sharded_runner.shard_sizes(n, shards), expected)
+
+
+class TestRunSharded(unittest.TestCase):
+    """
+    Unit tests for the `run_shard` and `run_sharded` functions.
+    """
+
+    def test_run_shard(self):
+        """
+        Test that a shard reports its size, times and finish times in
+        completion order.
+        """
+        report = sharded_runner.run_shard(20, 10, "virtual")
+        self.assertEqual(report["n"], 20)
+        self.assertLessEqual(report["start"], report["end"])
+        finished = report["finished"]
+        self.assertEqual(len(finished), 20)
+        self.assertEqual(finished, sorted(finished))
+
+    @parameterized.expand([
+        ("thread", "thread"),
+        ("process", "process"),
+    ])
+    def test_executors(self, _, executor):
+        """
+        Test that the delays of every shard come back, with one report per
+        shard.
+        """
+        delays, reports = sharded_runner.run_sharded(30, 10, 3, executor,
+                                                     "virtual", seed=43)
+        self.assertEqual(len(delays), 30)
+        self.assertEqual([report["n"] for report in reports], [10, 10, 10])
+        self.assertTrue(all("finished" not in report for report in reports))
+
+    def test_merged_by_finish_time(self):
+        """
+        Test that the delays of all shards are merged in finish-time
+        order.
+        """
+        finishes = []
+        run_shard = sharded_runner.run_shard
+
+        def record(*args):
+            report = run_shard(*args)
+            finishes.extend(report["finished"])
+            return report
+
+        with patch.object(sharded_runner, "run_shard", side_effect=record):
+            delays, _ = sharded_runner.run_sharded(30, 10, 3, "thread",
+                                                   "virtual")
+        self.assertEqual(delays, [delay for _, delay in sorted(finishes)])
+
+    def test_process_seeds(self):
+        """
+        Test that process shards with a seed draw different, repeatable
+        delays.
+        """
+        first, _ = sharded_runner.run_sharded(10, 10, 2, "process",
+                                              "virtual", seed=43)
+        second, _ = sharded_runner.run_sharded(10, 10, 2, "process",
+                                               "virtual", seed=43)
+        self.assertEqual(sorted(first), sorted(second))
+        self.assertEqual(len(set(first)), 10)
+
+    def test_unknown_executor(self):
+        """
+        Test that an unknown executor raises `ValueError`.
+        """
+        with self.assertRaises(ValueError):
+            sharded_runner.run_sharded(1, 1, 1, "fiber")
+
+
+class TestMeasureSharded(unittest.TestCase):
+    """
+    Unit tests for the `measure_sharded` function.
+    """
+
+    def test_report(self):
+        """
+        Test the aggregate and per-shard throughput report.
+        """
+        report = measure_runtime.measure_sharded(40, 10, 4, "thread",
+                                                 "virtual")
+        self.assertEqual(report["n"], 40)
+        self.assertEqual(report["shards"], 4)
+        self.assertEqual([shard["n"] for shard in report["per_shard"]],
+                         [10] * 4)
+        self.assertAlmostEqual(report["per_task"], report["elapsed"] / 40)
+        self.assertGreater(report["throughput"], 0)
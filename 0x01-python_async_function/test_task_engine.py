@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the TaskEngine Class
+
+This module provides a set of unit tests for the `TaskEngine` class from the
+`10-task_engine` module. Every test runs twice: once on `asyncio.TaskGroup`
+and once on the `_FallbackTaskGroup` used before Python 3.11, which is
+forced by hiding `asyncio.TaskGroup` for the duration of the test.
+"""
+
+import asyncio
+import unittest
+from contextlib import contextmanager
+from parameterized import parameterized
+
+task_engine = __import__('10-task_engine')
+TaskEngine = task_engine.TaskEngine
+TaskErrors = task_engine.TaskErrors
+
+GROUPS = [
+    ("taskgroup", True),
+    ("fallback", False),
+]
+
+
+@contextmanager
+def task_group(native):
+    """
+    Make `TaskEngine` use `asyncio.TaskGroup` or, if `native` is false,
+    its fallback group.
+    """
+    saved = getattr(asyncio, "TaskGroup", None)
+    if native and saved is None:
+        raise unittest.SkipTest("asyncio.TaskGroup needs Python 3.11")
+    if not native and saved is not None:
+        del asyncio.TaskGroup
+    try:
+        yield
+    finally:
+        if saved is not None:
+            asyncio.TaskGroup = saved
+
+
+class TestTaskEngine(unittest.TestCase):
+    """
+    Unit tests for the `TaskEngine` class.
+    """
+
+    def run_engine(self, native, main):
+        """
+        Run `main` on a new event loop with the chosen task group.
+        """
+        with task_group(native):
+            return asyncio.run(main())
+
+    @parameterized.expand(GROUPS)
+    def test_results(self, _, native):
+        """
+        Test that spawned tasks run on the chosen group and the engine
+        waits for them.
+        """
+        async def main():
+            engine = TaskEngine()
+            async with engine:
+                self.assertEqual(
+                    isinstance(engine._group, task_engine._FallbackTaskGroup),
+                    not native)
+                futures = [engine.spawn(asyncio.sleep(0, i))
+                           for i in range(3)]
+            self.assertFalse(engine.running)
+            return [future.result() for future in futures]
+
+        self.assertEqual(self.run_engine(native, main), [0, 1, 2])
+
+    @parameterized.expand(GROUPS)
+    def test_failure_cancels_the_rest(self, _, native):
+        """
+        Test that a failing task cancels the others and that its error is
+        raised as a `TaskErrors` group when the engine exits.
+        """
+        async def fail():
+            await asyncio.sleep(0)
+            raise KeyError("boom")
+
+        async def main():
+            engine = TaskEngine()
+            slow = None
+            with self.assertRaises(TaskErrors) as caught:
+                async with engine:
+                    slow = engine.spawn(asyncio.sleep(10))
+                    engine.spawn(fail())
+            self.assertTrue(slow.cancelled())
+            return caught.exception
+
+        errors = self.run_engine(native, main)
+        self.assertEqual([type(error) for error in errors.exceptions],
+                         [KeyError])
+
+    @parameterized.expand(GROUPS)
+    def test_failure_drops_queued(self, _, native):
+        """
+        Test that coroutines still queued when a task fails never start.
+        """
+        started = []
+
+        async def unit(index):
+            started.append(index)
+            await asyncio.sleep(0)
+            if index == 0:
+                raise ValueError(index)
+
+        async def main():
+            engine = TaskEngine(max_concurrency=1)
+            with self.assertRaises(TaskErrors):
+                async with engine:
+                    futures = [engine.spawn(unit(i)) for i in range(3)]
+            self.assertTrue(all(future.done() for future in futures[1:]))
+
+        self.run_engine(native, main)
+        self.assertEqual(started, [0])
+
+    @parameterized.expand(GROUPS)
+    def test_reuse(self, _, native):
+        """
+        Test that the engine can be entered again after a run, including a
+        failed one, but not while it is running.
+        """
+        async def fail():
+            raise KeyError("boom")
+
+        async def main():
+            engine = TaskEngine()
+            with self.assertRaises(TaskErrors):
+                async with engine:
+                    engine.spawn(fail())
+            async with engine:
+                with self.assertRaises(RuntimeError):
+                    async with engine:
+                        pass
+                future = engine.spawn(asyncio.sleep(0, "again"))
+            return future.result()
+
+        self.assertEqual(self.run_engine(native, main), "again")
+
+    @parameterized.expand(GROUPS)
+    def test_spawn_outside_run(self, _, native):
+        """
+        Test that spawning on an engine that is not running is refused and
+        the coroutine is closed.
+        """
+        async def main():
+            coro = asyncio.sleep(0)
+            with self.assertRaises(RuntimeError):
+                TaskEngine().spawn(coro)
+            self.assertIsNone(coro.cr_frame)
+
+        self.run_engine(native, main)
+
+    @parameterized.expand(GROUPS)
+    def test_priority_queue(self, _, native):
+        """
+        Test that at `max_concurrency` the queued coroutines start lowest
+        priority first, then in spawn order.
+        """
+        started = []
+
+        async def unit(name):
+            started.append(name)
+            await asyncio.sleep(0)
+
+        async def main():
+            engine = TaskEngine(max_concurrency=1)
+            async with engine:
+                engine.spawn(unit("first"), priority=9)
+                queued = engine.spawn(unit("c"), priority=2)
+                engine.spawn(unit("a"), priority=0)
+                engine.spawn(unit("b"), priority=1)
+                engine.spawn(unit("d"), priority=2)
+                self.assertNotIsInstance(queued, asyncio.Task)
+
+        self.run_engine(native, main)
+        self.assertEqual(started, ["first", "a", "b", "c", "d"])
+
+    @parameterized.expand(GROUPS)
+    def test_queued_future_cancel(self, _, native):
+        """
+        Test that cancelling a queued future keeps its coroutine from
+        starting.
+        """
+        started = []
+
+        async def unit(name):
+            started.append(name)
+            await asyncio.sleep(0)
+
+        async def main():
+            engine = TaskEngine(max_concurrency=1)
+            async with engine:
+                engine.spawn(unit("first"))
+                engine.spawn(unit("skipped")).cancel()
+                engine.spawn(unit("last"))
+
+        self.run_engine(native, main)
+        self.assertEqual(started, ["first", "last"])
+
+    def test_max_concurrency(self):
+        """
+        Test that `max_concurrency` must be at least 1.
+        """
+        with self.assertRaises(ValueError):
+            TaskEngine(max_concurrency=0)
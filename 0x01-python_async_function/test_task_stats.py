@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Task Scheduling Instrumentation
+
+This module provides a set of unit tests for the `Histogram` and
+`TaskStats` classes from the `7-task_stats` module, and for the `stats`
+option of `task_wait_n` from `4-tasks`. The instrumented runs use the
+virtual time event loop from `8-virtual_time`, whose timers fire exactly
+on time, so the wake-up lag is known.
+"""
+
+import unittest
+from parameterized import parameterized
+
+task_stats = __import__('7-task_stats')
+task_wait_n = __import__('4-tasks').task_wait_n
+event_loop_module = __import__('6-event_loop')
+Histogram = task_stats.Histogram
+TaskStats = task_stats.TaskStats
+
+
+class TestHistogram(unittest.TestCase):
+    """
+    Unit tests for the `Histogram` class.
+    """
+
+    def test_buckets(self):
+        """
+        Test that values are counted in the bucket of their upper bound,
+        with an overflow bucket past the last one.
+        """
+        histogram = Histogram([1, 2, 4])
+        for value in (0.5, 1, 1.5, 3, 10):
+            histogram.add(value)
+        self.assertEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.max, 10)
+        self.assertEqual(histogram.mean(), 16 / 5)
+
+    @parameterized.expand([
+        (40, 1),
+        (60, 2),
+        (80, 4),
+        (100, 10),
+    ])
+    def test_percentile(self, q, expected):
+        """
+        Test that a percentile is the bound of its bucket, or the maximum
+        in the overflow bucket.
+        """
+        histogram = Histogram([1, 2, 4])
+        for value in (0.5, 1, 1.5, 3, 10):
+            histogram.add(value)
+        self.assertEqual(histogram.percentile(q), expected)
+
+    def test_empty(self):
+        """
+        Test the summary of an empty histogram.
+        """
+        self.assertEqual(Histogram().summary(), {
+            "count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0,
+            "max": 0.0})
+
+
+class TestTaskStats(unittest.TestCase):
+    """
+    Unit tests for the `TaskStats` class.
+    """
+
+    def test_record(self):
+        """
+        Test that a timing's latency and lag reach the histograms, with
+        early wake-ups counted as no lag.
+        """
+        stats = TaskStats()
+        stats.record(requested=1.0, queued=0.0, started=0.5, woke=2.0)
+        stats.record(requested=1.0, queued=0.0, started=0.0, woke=0.75)
+        self.assertEqual(stats.timings[0].queue_latency, 0.5)
+        self.assertEqual(stats.timings[0].wake_lag, 0.5)
+        self.assertEqual(stats.total_lag, 0.5)
+        self.assertEqual(stats.wake_lag.count, 2)
+        self.assertEqual(stats.queue_latency.max, 0.5)
+
+    def test_keep_timings(self):
+        """
+        Test that with `keep_timings` off only the histograms are kept.
+        """
+        stats = TaskStats(keep_timings=False)
+        stats.record(1.0, 0.0, 0.0, 1.0)
+        self.assertEqual(stats.timings, [])
+        self.assertEqual(stats.summary()["queue_latency"]["count"], 1)
+
+    def test_task_wait_n(self):
+        """
+        Test that `task_wait_n` records one timing per task, matching the
+        returned delays, with no lag on a loop whose timers are exact.
+        """
+        stats = TaskStats()
+        delays = event_loop_module.run(task_wait_n(20, 10, stats), "virtual")
+        self.assertEqual(len(stats.timings), 20)
+        self.assertEqual(sorted(timing.requested for timing in stats.timings),
+                         sorted(delays))
+        for timing in stats.timings:
+            self.assertEqual(timing.queue_latency, 0)
+            self.assertAlmostEqual(timing.wake_lag, 0)
+        self.assertAlmostEqual(stats.total_lag, 0)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the TimerWheel Class
+
+This module provides a set of unit tests for the `TimerWheel` class from the
+`5-timer_wheel` module. The tests run on the virtual time event loop from
+`8-virtual_time`, so wake-up times can be checked exactly.
+"""
+
+import asyncio
+import random
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+
+TimerWheel = __import__('5-timer_wheel').TimerWheel
+wait_n = __import__('1-concurrent_coroutines').wait_n
+event_loop_module = __import__('6-event_loop')
+
+
+def run_virtual(main):
+    """
+    Run `main` on a virtual time event loop and return its result.
+    """
+    return event_loop_module.run(main, "virtual")
+
+
+class TestTimerWheel(unittest.TestCase):
+    """
+    Unit tests for the `TimerWheel` class.
+    """
+
+    def test_one_timer_per_slot(self):
+        """
+        Test that sleeps ending in the same slot share one loop timer, and
+        wake at the end of their slot in deadline order.
+        """
+        wheel = TimerWheel(0.1)
+        woke = []
+
+        async def sleeper(delay):
+            await wheel.sleep(delay)
+            woke.append((delay, asyncio.get_event_loop().time()))
+
+        async def main():
+            loop = asyncio.get_event_loop()
+            delays = [0.05, 0.01, 0.1, 0.03, 0.15, 0.12]
+            with patch.object(loop, "call_at", wraps=loop.call_at) as timer:
+                await asyncio.gather(*(sleeper(delay) for delay in delays))
+            return timer.call_count
+
+        self.assertEqual(run_virtual(main()), 2)
+        self.assertEqual([delay for delay, _ in woke],
+                         [0.01, 0.03, 0.05, 0.1, 0.12, 0.15])
+        for delay, time in woke:
+            self.assertGreaterEqual(time, delay)
+            self.assertLess(time - delay, 0.1)
+            self.assertAlmostEqual(time, 0.1 if delay <= 0.1 else 0.2)
+
+    def test_new_loop(self):
+        """
+        Test that a wheel can be reused on a new event loop.
+        """
+        wheel = TimerWheel()
+        for _ in range(2):
+            run_virtual(wheel.sleep(1))
+
+    def test_wait_n(self):
+        """
+        Test that `wait_n` on a wheel returns every delay in ascending
+        order, as slot after slot fires in deadline order.
+        """
+        random.seed(33)
+        delays = run_virtual(wait_n(100, 10, wheel=TimerWheel(1)))
+        self.assertEqual(len(delays), 100)
+        self.assertEqual(delays, sorted(delays))
+
+    @parameterized.expand([
+        ("zero", 0),
+        ("negative", -0.1),
+    ])
+    def test_resolution(self, _, resolution):
+        """
+        Test that the resolution must be positive.
+        """
+        with self.assertRaises(ValueError):
+            TimerWheel(resolution)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the VirtualTimeEventLoop Class
+
+This module provides a set of unit tests for the `VirtualTimeEventLoop`
+class from the `8-virtual_time` module: sleeps end at once on a clock that
+jumps to the next timer, keep their order and reported delays, and work
+alongside real I/O from other threads.
+"""
+
+import asyncio
+import random
+import time
+import unittest
+
+VirtualTimeEventLoop = __import__('8-virtual_time').VirtualTimeEventLoop
+wait_n = __import__('1-concurrent_coroutines').wait_n
+measure_time = __import__('2-measure_runtime').measure_time
+
+
+class TestVirtualTimeEventLoop(unittest.TestCase):
+    """
+    Unit tests for the `VirtualTimeEventLoop` class.
+    """
+
+    def setUp(self):
+        """
+        Create a virtual time loop.
+        """
+        self.loop = VirtualTimeEventLoop()
+        self.addCleanup(self.loop.close)
+
+    def test_sleep_is_instant(self):
+        """
+        Test that a long sleep returns at once with the clock moved on.
+        """
+        start = time.perf_counter()
+        self.loop.run_until_complete(asyncio.sleep(3600))
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(self.loop.time(), 3600)
+
+    def test_order_preserved(self):
+        """
+        Test that sleeps end in deadline order at their deadlines.
+        """
+        woke = []
+
+        async def sleeper(delay):
+            await asyncio.sleep(delay)
+            woke.append((delay, asyncio.get_event_loop().time()))
+
+        async def main():
+            await asyncio.gather(*(sleeper(delay) for delay in (3, 1, 2, 1)))
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(woke, [(1, 1), (1, 1), (2, 2), (3, 3)])
+
+    def test_wait_n(self):
+        """
+        Test that `wait_n` returns its delays sorted, finishing when the
+        longest one ends.
+        """
+        random.seed(37)
+        delays = self.loop.run_until_complete(wait_n(100, 10))
+        self.assertEqual(delays, sorted(delays))
+        self.assertAlmostEqual(self.loop.time(), delays[-1])
+
+    def test_other_threads(self):
+        """
+        Test that work finished by another thread still wakes the loop.
+        """
+        result = self.loop.run_until_complete(
+            self.loop.run_in_executor(None, time.sleep, 0.01))
+        self.assertIsNone(result)
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+
+    def test_measure_time(self):
+        """
+        Test that `measure_time` on the virtual loop reports the longest
+        delay divided by `n`.
+        """
+        random.seed(37)
+        expected = max(random.uniform(0, 10) for _ in range(50)) / 50
+        random.seed(37)
+        self.assertAlmostEqual(measure_time(50, 10, loop="virtual"),
+                               expected)
@@ -5,14 +5,103 @@ This module provides an asynchronous generator function.
 
 It includes the `async_generator` function, which generates a sequence of
 10 random float numbers between 0 and 10, with a 1-second delay between each.
+The count, the pacing and the batching are configurable, and batches can be
+prefetched while the consumer works on the current one. The `pump`
+function, which moves a stream into a queue, is shared by the modules that
+run generators in background tasks.
 """
 
 import asyncio
+import itertools
 import random
-from typing import Generator
+from array import array
+from typing import (Any, AsyncGenerator, AsyncIterator, Awaitable, Callable,
+                    Iterable, Optional, Tuple, Union)
 
 
-async def async_generator() -> Generator[float, None, None]:
+END = object()
+
+
+def _ticks(count: Optional[int]) -> Iterable[int]:
+    """
+    Return `range(count)`, or an endless counter when `count` is None.
+    """
+    return itertools.count() if count is None else range(count)
+
+
+async def _floats(count: Optional[int],
+                  interval: float) -> AsyncGenerator[float, None]:
+    """
+    Asynchronously generate `count` random floats, waiting `interval`
+    seconds before each.
+    """
+    for _ in _ticks(count):
+        await asyncio.sleep(interval)
+        yield random.uniform(0, 10)
+
+
+async def _batches(count: Optional[int], interval: float,
+                   batch_size: int) -> AsyncGenerator[array, None]:
+    """
+    Asynchronously generate `count` random floats in `array('d')` batches
+    of up to `batch_size`, waiting `interval` seconds before each batch.
+    """
+    uniform = random.uniform
+    for index in _ticks(None if count is None
+                        else -(-count // batch_size)):
+        await asyncio.sleep(interval)
+        size = (batch_size if count is None
+                else min(batch_size, count - index * batch_size))
+        yield array('d', [uniform(0, 10) for _ in range(size)])
+
+
+async def pump(source: AsyncIterator,
+               put: Callable[[Tuple[Any, Optional[Exception]]],
+                             Awaitable[None]]) -> None:
+    """
+    Asynchronously pass each item of `source` to `put` as `(item, None)`,
+    then `(END, None)`, or `(END, error)` if the source raises.
+
+    The source is closed however the pump ends, including when its task is
+    cancelled. This is how `async_generator` and the merge, pipeline and
+    bridge modules hand a stream over to a queue.
+    """
+    try:
+        async for item in source:
+            await put((item, None))
+    except Exception as error:
+        await put((END, error))
+        return
+    finally:
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    await put((END, None))
+
+
+async def _prefetch(source: AsyncGenerator) -> AsyncGenerator:
+    """
+    Asynchronously re-yield `source`, producing its next item in the
+    background while the consumer handles the current one.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    producer = asyncio.ensure_future(pump(source, queue.put))
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        producer.cancel()
+
+
+async def async_generator(count: Optional[int] = 10, interval: float = 1,
+                          batch_size: Optional[int] = None,
+                          prefetch: bool = False
+                          ) -> AsyncGenerator[Union[float, array], None]:
     """
     Asynchronously generate 10 random float numbers between 0 and 10.
 
@@ -21,10 +110,41 @@ async def async_generator() -> Generator[float, None, None]:
     `await asyncio.sleep(1)`.
     The function yields each float as it is generated.
 
+    With `batch_size`, it yields `array('d')` buffers of up to that many
+    floats instead, waiting `interval` once per buffer. With `prefetch`,
+    the next buffer is produced while the consumer processes the current
+    one.
+
+    Parameters:
+    count (int, optional): The number of floats, or None to generate
+    forever. Defaults to 10.
+    interval (float, optional): The delay in seconds before each yield.
+    Defaults to 1.
+    batch_size (int, optional): The number of floats per buffer.
+    Defaults to None (one float per yield).
+    prefetch (bool, optional): Produce ahead of the consumer.
+    Defaults to False.
+
     Returns:
     AsyncGenerator[float, None]: An asynchronous generator of random floats
     between 0 and 10
     """
-    for _ in range(10):
-        await asyncio.sleep(1)
-        yield random.uniform(0, 10)
+    if batch_size is None and not prefetch:
+        for _ in _ticks(count):
+            await asyncio.sleep(interval)
+            yield random.uniform(0, 10)
+        return
+
+    if batch_size is None:
+        source = _floats(count, interval)
+    elif batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    else:
+        source = _batches(count, interval, batch_size)
+    if prefetch:
+        source = _prefetch(source)
+    try:
+        async for item in source:
+            yield item
+    finally:
+        await source.aclose()
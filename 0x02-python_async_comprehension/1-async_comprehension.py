@@ -5,13 +5,22 @@ This module provides an asynchronous comprehension example.
 
 It includes the `async_comprehension` function, which collects 10
 random float numbers generated by `async_generator` into a list
-using asynchronous comprehension.
+using asynchronous comprehension, and `async_merge_comprehension`, which
+does the same over several generators merged by `amerge`. The
+`async_summary` alternative reduces the stream as it arrives instead of
+building a list, `async_summaries` reports on a generator that never
+stops as it goes, and
+`async_array_comprehension` collects the floats into one `array('d')`.
 """
 
-from typing import List
+from array import array
+from typing import AsyncGenerator, Dict, List, Optional, Sequence
 
 
 async_generator = __import__('0-async_generator').async_generator
+amerge = __import__('3-amerge').amerge
+summarize = __import__('4-stream_stats').summarize
+iter_summaries = __import__('4-stream_stats').iter_summaries
 
 
 async def async_comprehension() -> List[float]:
@@ -27,3 +36,115 @@ async def async_comprehension() -> List[float]:
     `async_generator`.
     """
     return [number async for number in async_generator()]
+
+
+def async_merged(streams: int = 4,
+                 maxsize: int = 16) -> AsyncGenerator[float, None]:
+    """
+    Merge `streams` concurrent `async_generator` streams with `amerge`.
+
+    Parameters:
+    streams (int, optional): The number of generators. Defaults to 4.
+    maxsize (int, optional): The most floats buffered. Defaults to 16.
+
+    Returns:
+    AsyncGenerator[float, None]: Every float in arrival order.
+    """
+    return amerge(*(async_generator() for _ in range(streams)),
+                  maxsize=maxsize)
+
+
+async def async_merge_comprehension(streams: int = 4) -> List[float]:
+    """
+    Collect the random floats of `streams` concurrent `async_generator`
+    streams into one list, in the order they arrive.
+
+    The generators run side by side, so this takes as long as a single
+    `async_comprehension` while returning `10 * streams` numbers.
+
+    Parameters:
+    streams (int, optional): The number of generators. Defaults to 4.
+
+    Returns:
+    list[float]: The floats of every generator in arrival order.
+    """
+    return [number async for number in async_merged(streams)]
+
+
+async def async_summary(count: int = 10,
+                        percentiles: Sequence[float] = (50, 95, 99),
+                        window: int = 0,
+                        batch_size: Optional[int] = None
+                        ) -> Dict[str, object]:
+    """
+    Summarize the random floats of `async_generator` without keeping them.
+
+    The count, sum, mean, standard deviation, min, max and percentile
+    estimates are updated as each float arrives, in constant memory.
+
+    Parameters:
+    count (int, optional): The number of floats. Defaults to 10.
+    percentiles (Sequence[float], optional): The percentiles to estimate.
+    Defaults to (50, 95, 99).
+    window (int, optional): Also report the stats of the last `window`
+    floats. Defaults to 0 (no window).
+    batch_size (int, optional): Generate the floats in batches of this
+    size. Defaults to None.
+
+    Returns:
+    Dict[str, object]: The summary from `summarize` in `4-stream_stats`.
+    """
+    if count is None:
+        raise ValueError("async_summary needs a finite count; use "
+                         "async_summaries for an endless stream")
+    return await summarize(async_generator(count, batch_size=batch_size),
+                           percentiles, window)
+
+
+def async_summaries(count: Optional[int] = None, every: int = 10,
+                    percentiles: Sequence[float] = (50, 95, 99),
+                    window: int = 0,
+                    batch_size: Optional[int] = None
+                    ) -> AsyncGenerator[Dict[str, object], None]:
+    """
+    Stream snapshots of the statistics of `async_generator`.
+
+    Parameters:
+    count (int, optional): The number of floats. Defaults to None (an
+    endless stream; stop iterating to stop it).
+    every (int, optional): The number of floats between snapshots.
+    Defaults to 10.
+    percentiles, window, batch_size: As for `async_summary`.
+
+    Returns:
+    AsyncGenerator: The snapshots from `iter_summaries` in
+    `4-stream_stats`.
+    """
+    return iter_summaries(async_generator(count, batch_size=batch_size),
+                          every, percentiles, window)
+
+
+async def async_array_comprehension(count: int = 10,
+                                    batch_size: Optional[int] = None
+                                    ) -> array:
+    """
+    Collect the random floats of `async_generator` into a contiguous
+    `array('d')` instead of a list of float objects.
+
+    With `batch_size`, each batch is copied in with a single `extend`.
+
+    Parameters:
+    count (int, optional): The number of floats. Defaults to 10.
+    batch_size (int, optional): Generate the floats in batches of this
+    size. Defaults to None.
+
+    Returns:
+    array: The `count` random floats, in order.
+    """
+    floats = array('d')
+    async for item in async_generator(count, batch_size=batch_size):
+        if isinstance(item, array):
+            floats.extend(item)
+        else:
+            floats.append(item)
+    return floats
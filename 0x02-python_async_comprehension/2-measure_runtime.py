@@ -6,13 +6,17 @@ asynchronous tasks.
 
 It includes the `measure_runtime` function, which measures the total
 time taken to execute four instances of the `async_comprehension`
-function concurrently.
+function concurrently, and the `measure_runtime_breakdown` function, which
+also times each comprehension and each of its yields to show how much the
+comprehensions actually overlapped.
 """
 
 import asyncio
 import time
+from typing import Dict, List
 
 async_comprehension = __import__('1-async_comprehension').async_comprehension
+async_generator = __import__('0-async_generator').async_generator
 
 
 async def measure_runtime() -> float:
@@ -36,3 +40,61 @@ async def measure_runtime() -> float:
     end_time = time.perf_counter()
 
     return end_time - start_time
+
+
+async def _timed_comprehension(origin: float) -> Dict[str, object]:
+    """
+    Run the comprehension of `async_comprehension`, stamping its start,
+    its end and every yield relative to `origin` on the event loop's clock.
+    """
+    clock = asyncio.get_event_loop().time
+    start_time = last = clock()
+    latencies: List[float] = []
+    count = 0
+    async for _ in async_generator():
+        now = clock()
+        latencies.append(now - last)
+        last = now
+        count += 1
+    end_time = clock()
+    return {
+        "start": start_time - origin,
+        "end": end_time - origin,
+        "duration": end_time - start_time,
+        "latencies": latencies,
+        "count": count,
+    }
+
+
+async def measure_runtime_breakdown(count: int = 4) -> Dict[str, object]:
+    """
+    Measure `count` concurrent comprehensions like `measure_runtime`,
+    reporting each one separately.
+
+    The overlap ratio is the sum of the individual durations over the wall
+    time: about `count` when the comprehensions ran side by side and about
+    1 when they ran one after another. Times come from the event loop's
+    clock, as in `run_timed`, so they stay meaningful on a virtual time
+    loop.
+
+    Parameters:
+    count (int, optional): The number of comprehensions. Defaults to 4.
+
+    Returns:
+    Dict[str, object]: The "wall" time, the "overlap" ratio and, under
+    "coroutines", each comprehension's "start" and "end" (seconds from
+    the start of the measurement), "duration", "count" and per-yield
+    inter-arrival "latencies".
+    """
+    clock = asyncio.get_event_loop().time
+    start_time = clock()
+    coroutines = await asyncio.gather(
+        *(_timed_comprehension(start_time) for _ in range(count)))
+    wall = clock() - start_time
+
+    busy = sum(coroutine["duration"] for coroutine in coroutines)
+    return {
+        "wall": wall,
+        "overlap": busy / wall if wall else 0.0,
+        "coroutines": list(coroutines),
+    }
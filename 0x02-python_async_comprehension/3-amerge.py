@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a fan-in merge of asynchronous iterators.
+
+It includes the `amerge` function, which consumes several `async_generator`
+streams concurrently and yields their items in arrival order, holding at
+most `maxsize` unconsumed items in between.
+"""
+
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, TypeVar
+
+END = __import__('0-async_generator').END
+pump = __import__('0-async_generator').pump
+
+T = TypeVar("T")
+
+
+async def amerge(*sources: AsyncIterator[T],
+                 maxsize: int = 16) -> AsyncGenerator[T, None]:
+    """
+    Asynchronously yield the items of all `sources` as they arrive.
+
+    Each source is pumped by its own task into one bounded queue, so a slow
+    consumer makes the sources wait instead of piling up items. The first
+    error from a source is raised, and closing the merge early cancels the
+    pumps and closes the sources.
+
+    Parameters:
+    *sources (AsyncIterator): The asynchronous iterators to merge.
+    maxsize (int, optional): The most items buffered between the sources
+    and the consumer. Defaults to 16.
+
+    Returns:
+    AsyncGenerator: The items of every source in arrival order.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+    pumps = [asyncio.ensure_future(pump(source, queue.put))
+             for source in sources]
+    remaining = len(pumps)
+    try:
+        while remaining:
+            item, error = await queue.get()
+            if item is END:
+                if error is not None:
+                    raise error
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in pumps:
+            task.cancel()
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+
+"""
+This module provides streaming reductions over asynchronous float streams.
+
+It includes the `RunningStats`, `P2Quantile` and `WindowStats` reducers,
+the `StreamSummary` that combines them, and the `reduce_stream` function,
+which feeds them from `async_generator` one value at a time. None of them
+keeps the stream; `WindowStats` keeps only its last `size` values. For
+producers that never stop, `iter_summaries` yields periodic snapshots.
+"""
+
+import bisect
+import math
+from array import array
+from collections import deque
+from typing import (AsyncGenerator, AsyncIterable, Deque, Dict, Iterable,
+                    Sequence, Tuple, TypeVar, Union)
+
+
+R = TypeVar("R")
+
+
+class RunningStats:
+    """
+    Count, sum, mean, variance, minimum and maximum of a stream.
+
+    The variance uses Welford's update, which stays accurate over long
+    streams where a plain sum of squares would not.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty reducer.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._squares = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Fold `value` into the statistics.
+        """
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def variance(self) -> float:
+        """
+        Return the sample variance, or 0 with fewer than two values.
+        """
+        return self._squares / (self.count - 1) if self.count > 1 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the count, sum, mean, standard deviation, min and max.
+        """
+        empty = not self.count
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "stdev": math.sqrt(self.variance()),
+            "min": 0.0 if empty else self.min,
+            "max": 0.0 if empty else self.max,
+        }
+
+
+class P2Quantile:
+    """
+    Estimate one percentile of a stream with the P-square algorithm.
+
+    Five markers track the minimum, the `q / 2`, `q` and `(100 + q) / 2`
+    percentiles and the maximum, and are nudged towards their ideal
+    positions as values arrive (Jain and Chlamtac, 1985). The first five
+    values are kept as they are, so short streams get the exact answer.
+    """
+
+    def __init__(self, q: float) -> None:
+        """
+        Create an estimator for the `q` percentile (0-100, exclusive).
+        """
+        if not 0 < q < 100:
+            raise ValueError("q must be between 0 and 100")
+        p = q / 100
+        self.q = q
+        self.count = 0
+        self._heights: list = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        """
+        Fold `value` into the estimate.
+        """
+        self.count += 1
+        heights = self._heights
+        if len(heights) < 5:
+            bisect.insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect.bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            self._desired[index] += self._increments[index]
+
+        for index in range(1, 4):
+            offset = self._desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1
+                    or offset <= -1
+                    and positions[index - 1] - positions[index] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = self._linear(index, step)
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        """
+        Return the piecewise-parabolic adjustment of marker `index`.
+        """
+        h = self._heights
+        n = self._positions
+        return h[index] + step / (n[index + 1] - n[index - 1]) * (
+            (n[index] - n[index - 1] + step)
+            * (h[index + 1] - h[index]) / (n[index + 1] - n[index])
+            + (n[index + 1] - n[index] - step)
+            * (h[index] - h[index - 1]) / (n[index] - n[index - 1]))
+
+    def _linear(self, index: int, step: int) -> float:
+        """
+        Return the linear adjustment of marker `index`.
+        """
+        h = self._heights
+        n = self._positions
+        return h[index] + step * (h[index + step] - h[index]) / (
+            n[index + step] - n[index])
+
+    def value(self) -> float:
+        """
+        Return the estimated percentile, or 0 for an empty stream.
+        """
+        heights = self._heights
+        if not heights:
+            return 0.0
+        if self.count <= 5:
+            rank = math.ceil(self.q / 100 * len(heights))
+            return heights[max(0, rank - 1)]
+        return heights[2]
+
+
+class WindowStats:
+    """
+    Mean, minimum and maximum of the last `size` values of a stream.
+
+    The sum is updated as values enter and leave the window, and the
+    minimum and maximum come from monotonic deques, so each value costs
+    amortised O(1) work.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create an empty window of `size` values.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.count = 0
+        self.total = 0.0
+        self._values: Deque[float] = deque()
+        self._mins: Deque[Tuple[int, float]] = deque()
+        self._maxes: Deque[Tuple[int, float]] = deque()
+
+    def add(self, value: float) -> None:
+        """
+        Push `value` into the window, dropping the oldest value if full.
+        """
+        index = self.count
+        self.count += 1
+        self._values.append(value)
+        self.total += value
+        if len(self._values) > self.size:
+            self.total -= self._values.popleft()
+        oldest = index - self.size
+
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((index, value))
+        if self._mins[0][0] <= oldest:
+            self._mins.popleft()
+
+        while self._maxes and self._maxes[-1][1] <= value:
+            self._maxes.pop()
+        self._maxes.append((index, value))
+        if self._maxes[0][0] <= oldest:
+            self._maxes.popleft()
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the length, mean, min and max of the current window.
+        """
+        length = len(self._values)
+        return {
+            "length": length,
+            "mean": self.total / length if length else 0.0,
+            "min": self._mins[0][1] if length else 0.0,
+            "max": self._maxes[0][1] if length else 0.0,
+        }
+
+
+async def reduce_stream(stream: AsyncIterable[Union[float, array]],
+                        *reducers: R) -> Tuple[R, ...]:
+    """
+    Asynchronously feed every value of `stream` to every reducer.
+
+    Batches from `async_generator(batch_size=...)` are unpacked, so the
+    reducers always see single floats.
+
+    Parameters:
+    stream (AsyncIterable): The floats or `array('d')` batches to reduce.
+    *reducers: Objects with an `add(value)` method.
+
+    Returns:
+    Tuple: The reducers, once the stream is exhausted.
+    """
+    adds = [reducer.add for reducer in reducers]
+    async for item in stream:
+        values: Iterable[float] = (item if isinstance(item, array)
+                                   else (item,))
+        for value in values:
+            for add in adds:
+                add(value)
+    return reducers
+
+
+class StreamSummary:
+    """
+    The `RunningStats`, percentile estimates and optional window of one
+    stream, read together with `summary`.
+
+    Pass it to `reduce_stream` and call `summary` at any time, including
+    from another task while an endless stream is still being reduced.
+    """
+
+    def __init__(self, percentiles: Sequence[float] = (50, 95, 99),
+                 window: int = 0) -> None:
+        """
+        Create the reducers for `percentiles` and, if `window` is set, for
+        the last `window` values.
+        """
+        self.running = RunningStats()
+        self.quantiles = [P2Quantile(q) for q in percentiles]
+        self.window = WindowStats(window) if window else None
+
+    @property
+    def count(self) -> int:
+        """
+        The number of values seen.
+        """
+        return self.running.count
+
+    def add(self, value: float) -> None:
+        """
+        Fold `value` into every reducer.
+        """
+        self.running.add(value)
+        for quantile in self.quantiles:
+            quantile.add(value)
+        if self.window is not None:
+            self.window.add(value)
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Return the `RunningStats` summary, a "pNN" entry per percentile
+        and, with a window, a "window" summary.
+        """
+        summary: Dict[str, object] = dict(self.running.summary())
+        for quantile in self.quantiles:
+            summary["p{:g}".format(quantile.q)] = quantile.value()
+        if self.window is not None:
+            summary["window"] = self.window.summary()
+        return summary
+
+
+async def summarize(stream: AsyncIterable[Union[float, array]],
+                    percentiles: Sequence[float] = (50, 95, 99),
+                    window: int = 0) -> Dict[str, object]:
+    """
+    Asynchronously reduce a finite `stream` to its running statistics.
+
+    Parameters:
+    stream (AsyncIterable): The floats or `array('d')` batches to reduce.
+    percentiles (Sequence[float], optional): The percentiles to estimate.
+    Defaults to (50, 95, 99).
+    window (int, optional): Also report the stats of the last `window`
+    values. Defaults to 0 (no window).
+
+    Returns:
+    Dict[str, object]: The `StreamSummary` summary of the whole stream.
+    """
+    summary = StreamSummary(percentiles, window)
+    await reduce_stream(stream, summary)
+    return summary.summary()
+
+
+async def iter_summaries(stream: AsyncIterable[Union[float, array]],
+                         every: int = 10,
+                         percentiles: Sequence[float] = (50, 95, 99),
+                         window: int = 0
+                         ) -> AsyncGenerator[Dict[str, object], None]:
+    """
+    Asynchronously yield a snapshot of the running statistics of `stream`
+    every `every` values, and a last one when a finite stream ends.
+
+    This is the form for endless streams: the caller reads snapshots as
+    they come and stops iterating when it has seen enough. With batches,
+    a snapshot is taken after the batch that crosses each boundary.
+
+    Parameters:
+    stream (AsyncIterable): The floats or `array('d')` batches to reduce.
+    every (int, optional): The number of values between snapshots.
+    Defaults to 10.
+    percentiles (Sequence[float], optional): The percentiles to estimate.
+    Defaults to (50, 95, 99).
+    window (int, optional): Also report the stats of the last `window`
+    values. Defaults to 0 (no window).
+
+    Yields:
+    Dict[str, object]: The `StreamSummary` summary so far.
+    """
+    if every < 1:
+        raise ValueError("every must be at least 1")
+    summary = StreamSummary(percentiles, window)
+    due = every
+    reported = 0
+    async for item in stream:
+        values: Iterable[float] = (item if isinstance(item, array)
+                                   else (item,))
+        for value in values:
+            summary.add(value)
+        if summary.count >= due:
+            due = (summary.count // every + 1) * every
+            reported = summary.count
+            yield summary.summary()
+    if summary.count != reported:
+        yield summary.summary()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a small streaming pipeline for asynchronous iterators.
+
+It includes the `Pipeline` class, which chains map, filter, batch and window
+stages behind a source such as `async_generator()`. Every stage runs in its
+own tasks and the stages are joined by bounded `asyncio.Queue`s, so a slow
+consumer blocks the stages and, in turn, the producer instead of letting
+items pile up:
+
+    Pipeline(async_generator()).map(round).batch(5).collect()
+"""
+
+import asyncio
+import inspect
+from collections import deque
+from typing import (Any, AsyncGenerator, AsyncIterable, Awaitable, Callable,
+                    Deque, List, Optional, Tuple)
+
+
+Emit = Callable[[Any], Awaitable[None]]
+Handler = Callable[[Any, Emit], Awaitable[None]]
+Flush = Optional[Callable[[Emit], Awaitable[None]]]
+
+END = __import__('0-async_generator').END
+pump = __import__('0-async_generator').pump
+
+
+async def _call(func: Callable, value: Any) -> Any:
+    """
+    Call `func` on `value`, awaiting the result if it is awaitable.
+    """
+    result = func(value)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class Pipeline:
+    """
+    Run a source through a chain of concurrent, bounded stages.
+
+    The stage methods return the pipeline, so they chain. Iterating the
+    pipeline (`async for` or `collect`) starts one task for the source and
+    `concurrency` tasks per stage; leaving the loop early cancels them and
+    closes the source. The first error of a stage or of the source is
+    raised to the consumer. With `concurrency` above 1 a stage emits in
+    completion order rather than source order.
+    """
+
+    def __init__(self, source: AsyncIterable, maxsize: int = 16) -> None:
+        """
+        Create a pipeline reading from `source`.
+
+        Parameters:
+        source (AsyncIterable): The items to process, such as
+        `async_generator()`.
+        maxsize (int, optional): The capacity of each queue between
+        stages. Defaults to 16.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.source = source
+        self.maxsize = maxsize
+        self._stages: List[Tuple[Handler, Flush, int]] = []
+
+    def _add(self, handle: Handler, flush: Flush = None,
+             concurrency: int = 1) -> "Pipeline":
+        """
+        Append a stage and return the pipeline.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._stages.append((handle, flush, concurrency))
+        return self
+
+    def map(self, func: Callable, concurrency: int = 1) -> "Pipeline":
+        """
+        Replace each item with `func(item)`; `func` may be a coroutine
+        function. Up to `concurrency` calls run at once.
+        """
+        async def handle(value: Any, emit: Emit) -> None:
+            """Emit the mapped item."""
+            await emit(await _call(func, value))
+
+        return self._add(handle, concurrency=concurrency)
+
+    def filter(self, predicate: Callable,
+               concurrency: int = 1) -> "Pipeline":
+        """
+        Keep the items for which `predicate(item)` is true; `predicate` may
+        be a coroutine function. Up to `concurrency` calls run at once.
+        """
+        async def handle(value: Any, emit: Emit) -> None:
+            """Emit the item if it passes."""
+            if await _call(predicate, value):
+                await emit(value)
+
+        return self._add(handle, concurrency=concurrency)
+
+    def batch(self, size: int) -> "Pipeline":
+        """
+        Group items into lists of `size`; the last list may be shorter.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        pending: List[Any] = []
+
+        async def handle(value: Any, emit: Emit) -> None:
+            """Emit a full batch."""
+            pending.append(value)
+            if len(pending) == size:
+                batch = pending[:]
+                pending.clear()
+                await emit(batch)
+
+        async def flush(emit: Emit) -> None:
+            """Emit the last, partial batch."""
+            if pending:
+                await emit(pending[:])
+                pending.clear()
+
+        return self._add(handle, flush)
+
+    def window(self, size: int, step: int = 1) -> "Pipeline":
+        """
+        Emit a tuple of the last `size` items every `step` items once
+        `size` items have been seen.
+        """
+        if size < 1 or step < 1:
+            raise ValueError("size and step must be at least 1")
+        recent: Deque[Any] = deque(maxlen=size)
+        seen = [0]
+
+        async def handle(value: Any, emit: Emit) -> None:
+            """Emit the window when it is due."""
+            recent.append(value)
+            seen[0] += 1
+            if seen[0] >= size and (seen[0] - size) % step == 0:
+                await emit(tuple(recent))
+
+        return self._add(handle)
+
+    async def __aiter__(self) -> AsyncGenerator[Any, None]:
+        """
+        Asynchronously run the pipeline and yield the items of its last
+        stage.
+        """
+        queue: asyncio.Queue = asyncio.Queue(self.maxsize)
+        tasks = [asyncio.ensure_future(pump(self.source, queue.put))]
+        for handle, flush, concurrency in self._stages:
+            output: asyncio.Queue = asyncio.Queue(self.maxsize)
+            workers = [concurrency]
+            tasks.extend(
+                asyncio.ensure_future(
+                    self._work(handle, flush, queue, output, workers))
+                for _ in range(concurrency))
+            queue = output
+
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is END:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _work(handle: Handler, flush: Flush, source: asyncio.Queue,
+                    output: asyncio.Queue, workers: List[int]) -> None:
+        """
+        Run `handle` on the items of `source` until `END`.
+
+        `END` is put back for the sibling workers of the stage, and the
+        last of them to finish flushes the stage and passes `END` on.
+        Errors skip the siblings and go straight downstream.
+        """
+        async def emit(value: Any) -> None:
+            """Pass a result to the next stage."""
+            await output.put((value, None))
+
+        try:
+            while True:
+                item, error = await source.get()
+                if item is END:
+                    if error is not None:
+                        await output.put((item, error))
+                        return
+                    source.put_nowait((item, None))
+                    break
+                await handle(item, emit)
+            workers[0] -= 1
+            if workers[0]:
+                return
+            if flush is not None:
+                await flush(emit)
+        except Exception as error:
+            await output.put((END, error))
+            return
+        await output.put((END, None))
+
+    async def collect(self) -> List[Any]:
+        """
+        Asynchronously run the pipeline and return all of its items.
+        """
+        return [item async for item in self]
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+This module provides a ring buffer for streaming floats between coroutines.
+
+It includes the `FloatRing` class, an `array('d')`-backed ring that a
+producer writes floats or whole batches into and a consumer reads
+`memoryview` slices from, and the `fill` and `drain` functions, which
+connect it to `async_generator` and to a contiguous `array('d')`. Batches
+are copied buffer to buffer, so no float is boxed on the way through.
+"""
+
+import asyncio
+from array import array
+from typing import AsyncIterable, List, Sequence, Union
+
+
+class FloatRing:
+    """
+    Fixed-capacity ring of floats for one producer and one consumer.
+
+    `write` and `put` wait while the ring is full, so a slow consumer
+    holds the producer back. `readable` returns the longest contiguous
+    slice of unread floats without copying; the consumer calls `consume`
+    once it is done with it. After `close`, reads drain what is left and
+    then return an empty slice.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """
+        Create an empty ring holding up to `capacity` floats.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.closed = False
+        self._buffer = array('d', bytes(8 * capacity))
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._size = 0
+        self._waiters: List[asyncio.Future] = []
+
+    def __len__(self) -> int:
+        """
+        Return the number of unread floats.
+        """
+        return self._size
+
+    async def _wait(self) -> None:
+        """
+        Asynchronously wait until the other side changes the ring.
+        """
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _wake(self) -> None:
+        """
+        Wake every coroutine waiting on the ring.
+        """
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _room(self) -> int:
+        """
+        Asynchronously wait for free space and return the write position.
+        """
+        while self._size == self.capacity and not self.closed:
+            await self._wait()
+        if self.closed:
+            raise ValueError("write to a closed FloatRing")
+        return (self._start + self._size) % self.capacity
+
+    async def put(self, value: float) -> None:
+        """
+        Asynchronously append one float.
+        """
+        self._buffer[await self._room()] = value
+        self._size += 1
+        self._wake()
+
+    async def write(self, values: Union[array, memoryview,
+                                        Sequence[float]]) -> None:
+        """
+        Asynchronously append a batch of floats, such as an `array('d')`
+        from `async_generator(batch_size=...)`, copying it in slices.
+        Other sequences are converted to an `array('d')` first.
+        """
+        if not isinstance(values, (array, memoryview)):
+            values = array('d', values)
+        source = memoryview(values)
+        if source.format != 'd':
+            source = memoryview(array('d', source.tolist()))
+        while source:
+            end = await self._room()
+            free = self.capacity - self._size
+            length = min(len(source), free, self.capacity - end)
+            self._view[end:end + length] = source[:length]
+            source = source[length:]
+            self._size += length
+            self._wake()
+
+    async def readable(self) -> memoryview:
+        """
+        Asynchronously wait for unread floats and return the longest
+        contiguous slice of them, or an empty slice once closed and drained.
+
+        The slice is a view of the ring and is only valid until `consume`.
+        """
+        while not self._size and not self.closed:
+            await self._wait()
+        end = min(self._start + self._size, self.capacity)
+        return self._view[self._start:end]
+
+    def consume(self, count: int) -> None:
+        """
+        Mark the first `count` unread floats as read, freeing their space.
+        """
+        if not 0 <= count <= self._size:
+            raise ValueError("cannot consume {} of {} floats".format(
+                count, self._size))
+        self._start = (self._start + count) % self.capacity
+        self._size -= count
+        self._wake()
+
+    def close(self) -> None:
+        """
+        Stop accepting writes and let the reader finish.
+        """
+        self.closed = True
+        self._wake()
+
+
+async def fill(ring: FloatRing,
+               stream: AsyncIterable[Union[float, array]]) -> None:
+    """
+    Asynchronously write every float or batch of `stream` into `ring`,
+    then close it.
+    """
+    try:
+        async for item in stream:
+            if isinstance(item, array):
+                await ring.write(item)
+            else:
+                await ring.put(item)
+    finally:
+        ring.close()
+
+
+async def drain(ring: FloatRing) -> array:
+    """
+    Asynchronously read `ring` until it is closed and return its floats as
+    one contiguous `array('d')`.
+    """
+    floats = array('d')
+    while True:
+        view = await ring.readable()
+        if not view:
+            return floats
+        floats.frombytes(view.cast('B'))
+        ring.consume(len(view))
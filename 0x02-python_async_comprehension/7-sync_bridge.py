@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+"""
+This module lets synchronous threads consume asynchronous generators.
+
+It includes the `LoopThread` class, an event loop running forever in a
+daemon thread and shared by every caller, the `BlockingIterator` class,
+which drives an asynchronous iterator such as `async_generator()` on that
+loop and hands its items to a blocking `for` loop through a bounded buffer,
+and the `stream` and `run_coroutine` functions built on a shared
+`LoopThread`. Calls no longer pay for a new event loop each time, and sync
+code sees each item as soon as it is produced.
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, AsyncIterator, Coroutine, Optional, Tuple
+
+
+async_generator = __import__('0-async_generator').async_generator
+END = __import__('0-async_generator').END
+pump = __import__('0-async_generator').pump
+
+
+async def _cancel_all() -> None:
+    """
+    Cancel every other task of the running loop and wait for them, so
+    their generators are closed before the loop stops.
+    """
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.get_event_loop().shutdown_asyncgens()
+
+
+class LoopThread:
+    """
+    An event loop running in its own daemon thread.
+
+    The loop is started on first use by `loop` and again after `stop`.
+    """
+
+    def __init__(self, name: str = "async-bridge") -> None:
+        """
+        Create a stopped loop thread called `name`.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the running loop, starting its thread if needed.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self.name,
+                    daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule `coro` on the loop and return a `concurrent.futures`
+        future for its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop())
+
+    def stop(self) -> None:
+        """
+        Cancel the tasks left on the loop, stop it, wait for its thread and
+        close it.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class _Buffer:
+    """
+    The bounded hand-over between a producer task and a consumer thread.
+
+    It is kept apart from `BlockingIterator` so that the producer task does
+    not keep the iterator alive, and dropping the iterator can close it.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Create an empty buffer of `maxsize` slots.
+        """
+        self.maxsize = maxsize
+        self.ended = False
+        self.items: queue.SimpleQueue = queue.SimpleQueue()
+        self.slots: Optional[asyncio.Semaphore] = None
+
+    async def put(self, entry: Tuple[Any, Optional[BaseException]]) -> None:
+        """
+        Take a slot and hand `entry` to the consumer thread.
+        """
+        if self.slots is None:
+            # created on the loop thread, which it belongs to
+            self.slots = asyncio.Semaphore(self.maxsize)
+        await self.slots.acquire()
+        self.ended = entry[0] is END
+        self.items.put(entry)
+
+    def finish(self, future: Future) -> None:
+        """
+        Hand `END` to the consumer thread if the producer `future` ended
+        without doing so, with `CancelledError` if it was cancelled, for
+        instance by `LoopThread.stop`.
+        """
+        if self.ended:
+            return
+        self.ended = True
+        error = (CancelledError() if future.cancelled()
+                 else future.exception())
+        self.items.put((END, error))
+
+    def release(self) -> None:
+        """
+        Give back the slot of an item the consumer took.
+        """
+        self.slots.release()
+
+
+class BlockingIterator:
+    """
+    Iterate an asynchronous iterator from synchronous code.
+
+    The source runs on a `LoopThread` and runs at most `maxsize` items
+    ahead of the consumer: each item takes a slot of an `asyncio.Semaphore`
+    and `__next__` gives the slot back through `call_soon_threadsafe`.
+    Errors from the source are raised by `__next__`. Leaving a `for` loop
+    early is enough to stop the source once the iterator is dropped;
+    `close`, or using it as a context manager, stops it right away. If the
+    loop thread is stopped first, `__next__` returns the items already
+    buffered and then raises `concurrent.futures.CancelledError`.
+    """
+
+    def __init__(self, source: AsyncIterator, maxsize: int = 16,
+                 runner: Optional[LoopThread] = None) -> None:
+        """
+        Start driving `source` on `runner` (the shared loop thread by
+        default), buffering up to `maxsize` items.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._runner = runner or shared_loop
+        self._loop = self._runner.loop()
+        self._buffer = _Buffer(maxsize)
+        self._done = False
+        self._future = self._runner.submit(pump(source, self._buffer.put))
+        self._future.add_done_callback(self._buffer.finish)
+
+    def __iter__(self) -> "BlockingIterator":
+        """
+        Return the iterator itself.
+        """
+        return self
+
+    def __next__(self) -> Any:
+        """
+        Block until the next item is ready and return it.
+        """
+        if self._done:
+            raise StopIteration
+        item, error = self._buffer.items.get()
+        if item is END:
+            closed, self._done = self._done, True
+            if error is not None and not closed:
+                raise error
+            raise StopIteration
+        try:
+            self._loop.call_soon_threadsafe(self._buffer.release)
+        except RuntimeError:
+            # the loop was stopped and closed; nobody waits for the slot
+            pass
+        return item
+
+    def close(self) -> None:
+        """
+        Cancel the source if it is still running, and wake a `__next__`
+        blocked in another thread, which then stops.
+        """
+        if self._done:
+            return
+        self._done = True
+        self._future.cancel()
+        self._buffer.items.put((END, None))
+
+    def __del__(self) -> None:
+        """
+        Close the iterator when it is dropped.
+        """
+        if hasattr(self, "_future"):
+            self.close()
+
+    def __enter__(self) -> "BlockingIterator":
+        """
+        Return the iterator.
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """
+        Close the iterator.
+        """
+        self.close()
+
+
+shared_loop = LoopThread()
+
+
+def stream(*args: Any, maxsize: int = 16, **kwargs: Any) -> BlockingIterator:
+    """
+    Iterate `async_generator(*args, **kwargs)` from synchronous code on the
+    shared loop thread.
+
+    Parameters:
+    *args, **kwargs: The arguments of `async_generator`.
+    maxsize (int, optional): The most items buffered ahead of the
+    consumer. Defaults to 16.
+
+    Returns:
+    BlockingIterator: The floats (or batches) as they are produced.
+    """
+    return BlockingIterator(async_generator(*args, **kwargs), maxsize)
+
+
+def run_coroutine(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run `coro`, such as `async_comprehension()`, on the shared loop thread
+    and block until it returns, instead of starting a new loop with
+    `asyncio.run`.
+
+    Parameters:
+    coro (Coroutine): The coroutine to run.
+    timeout (float, optional): The longest to wait, in seconds.
+    Defaults to None (no limit).
+
+    Returns:
+    Any: The result of `coro`.
+    """
+    return shared_loop.submit(coro).result(timeout)
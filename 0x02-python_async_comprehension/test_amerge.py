@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for amerge
+
+This module provides a set of unit tests for the `amerge` function from the
+`3-amerge` module: every item comes out once, the buffer between the
+sources and the consumer stays bounded, and a failing source or an early
+exit cancels the pumps and closes the sources.
+"""
+
+import asyncio
+import unittest
+
+amerge = __import__('3-amerge').amerge
+
+
+async def count_up(n, produced=None):
+    """
+    Asynchronously yield 0 to `n - 1`, or forever if `n` is None, counting
+    what was produced in `produced`.
+    """
+    value = 0
+    while n is None or value < n:
+        if produced is not None:
+            produced.append(value)
+        yield value
+        value += 1
+
+
+async def fail_after(n):
+    """
+    Asynchronously yield `n` values, then raise `KeyError`.
+    """
+    for value in range(n):
+        yield value
+    raise KeyError("source")
+
+
+async def settle():
+    """
+    Let cancelled tasks finish.
+    """
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAmerge(unittest.TestCase):
+    """
+    Unit tests for the `amerge` function.
+    """
+
+    def test_merges_every_item(self):
+        """
+        Test that every item of every source comes out once.
+        """
+        async def main():
+            return [item async for item in
+                    amerge(count_up(3), count_up(4), count_up(0))]
+
+        self.assertEqual(sorted(asyncio.run(main())),
+                         [0, 0, 1, 1, 2, 2, 3])
+
+    def test_bounded_and_early_exit(self):
+        """
+        Test that endless sources run at most `maxsize` items ahead of a
+        slow consumer, and that stopping early leaves no task behind.
+        """
+        first, second = [], []
+
+        async def main():
+            merged = amerge(count_up(None, first), count_up(None, second),
+                            maxsize=3)
+            seen = 0
+            async for _ in merged:
+                await asyncio.sleep(0.001)
+                seen += 1
+                if seen == 10:
+                    break
+            await merged.aclose()
+            await settle()
+            return len(asyncio.all_tasks())
+
+        self.assertEqual(asyncio.run(main()), 1)
+        self.assertLessEqual(len(first) + len(second), 10 + 3 + 2)
+
+    def test_error_and_cleanup(self):
+        """
+        Test that a failing source raises to the consumer and the other
+        sources are closed.
+        """
+        async def main():
+            with self.assertRaises(KeyError):
+                [item async for item in
+                 amerge(fail_after(2), count_up(None))]
+            await settle()
+            return len(asyncio.all_tasks())
+
+        self.assertEqual(asyncio.run(main()), 1)
+
+    def test_maxsize(self):
+        """
+        Test that `maxsize` must be at least 1.
+        """
+        async def main():
+            with self.assertRaises(ValueError):
+                await amerge(count_up(1), maxsize=0).__anext__()
+
+        asyncio.run(main())
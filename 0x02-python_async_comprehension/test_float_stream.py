@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the FloatRing Class
+
+This module provides a set of unit tests for the `FloatRing` class and the
+`fill` and `drain` functions from the `6-float_stream` module, with ring
+capacities small enough that every write and read wraps around.
+"""
+
+import asyncio
+import unittest
+from array import array
+from parameterized import parameterized
+
+float_stream = __import__('6-float_stream')
+FloatRing = float_stream.FloatRing
+
+
+async def batches(values, batch_size):
+    """
+    Asynchronously yield `values` in `array('d')` batches, or one float at
+    a time when `batch_size` is None.
+    """
+    if batch_size is None:
+        for value in values:
+            yield value
+        return
+    for start in range(0, len(values), batch_size):
+        yield array('d', values[start:start + batch_size])
+
+
+class TestFloatRing(unittest.TestCase):
+    """
+    Unit tests for the `FloatRing` class.
+    """
+
+    values = [float(value) for value in range(100)]
+
+    @parameterized.expand([
+        (1, None),
+        (3, 2),
+        (7, 5),
+        (7, 20),
+        (64, 13),
+    ])
+    def test_fill_and_drain(self, capacity, batch_size):
+        """
+        Test that the floats come out in order whatever the capacity and
+        batch size.
+        """
+        async def main():
+            ring = FloatRing(capacity)
+            producer = asyncio.ensure_future(
+                float_stream.fill(ring, batches(self.values, batch_size)))
+            floats = await float_stream.drain(ring)
+            await producer
+            return floats
+
+        self.assertEqual(asyncio.run(main()), array('d', self.values))
+
+    def test_wraparound_slices(self):
+        """
+        Test that `readable` returns the contiguous part up to the end of
+        the buffer, then the wrapped part.
+        """
+        async def main():
+            ring = FloatRing(4)
+            await ring.write([1.0, 2.0, 3.0])
+            ring.consume(2)
+            await ring.write(array('d', [4.0, 5.0, 6.0]))
+            self.assertEqual(len(ring), 4)
+            first = (await ring.readable()).tolist()
+            ring.consume(len(first))
+            second = (await ring.readable()).tolist()
+            ring.consume(len(second))
+            return first, second
+
+        self.assertEqual(asyncio.run(main()), ([3.0, 4.0], [5.0, 6.0]))
+
+    def test_full_ring_blocks_writer(self):
+        """
+        Test that a write waits while the ring is full.
+        """
+        async def main():
+            ring = FloatRing(2)
+            writer = asyncio.ensure_future(ring.write([1.0, 2.0, 3.0]))
+            await asyncio.sleep(0)
+            self.assertFalse(writer.done())
+            ring.consume(1)
+            await writer
+            return len(ring)
+
+        self.assertEqual(asyncio.run(main()), 2)
+
+    def test_close(self):
+        """
+        Test that a closed ring drains to an empty slice and refuses
+        writes.
+        """
+        async def main():
+            ring = FloatRing(4)
+            await ring.put(1.0)
+            ring.close()
+            self.assertEqual((await ring.readable()).tolist(), [1.0])
+            ring.consume(1)
+            self.assertEqual(len(await ring.readable()), 0)
+            with self.assertRaises(ValueError):
+                await ring.put(2.0)
+
+        asyncio.run(main())
+
+    @parameterized.expand([
+        ("capacity", lambda ring: FloatRing(0)),
+        ("consume", lambda ring: ring.consume(1)),
+    ])
+    def test_invalid(self, _, action):
+        """
+        Test that a zero capacity and over-consuming are rejected.
+        """
+        with self.assertRaises(ValueError):
+            action(FloatRing(1))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Pipeline Class
+
+This module provides a set of unit tests for the `Pipeline` class from the
+`5-pipeline` module: stage results, end-of-stream flushing across
+concurrent workers, error propagation, backpressure and cleanup when the
+consumer stops early.
+"""
+
+import asyncio
+import unittest
+from parameterized import parameterized
+
+Pipeline = __import__('5-pipeline').Pipeline
+
+
+async def count_up(n, produced=None):
+    """
+    Asynchronously yield 0 to `n - 1`, or forever if `n` is None, counting
+    what was produced in `produced`.
+    """
+    value = 0
+    while n is None or value < n:
+        if produced is not None:
+            produced.append(value)
+        yield value
+        value += 1
+
+
+async def fail_after(n):
+    """
+    Asynchronously yield `n` values, then raise `KeyError`.
+    """
+    for value in range(n):
+        yield value
+    raise KeyError("source")
+
+
+async def settle():
+    """
+    Let cancelled tasks finish.
+    """
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPipeline(unittest.TestCase):
+    """
+    Unit tests for the `Pipeline` class.
+    """
+
+    @parameterized.expand([
+        ("map", lambda p: p.map(lambda x: x * 2), [0, 2, 4, 6, 8]),
+        ("filter", lambda p: p.filter(lambda x: x % 2), [1, 3]),
+        ("batch", lambda p: p.batch(2), [[0, 1], [2, 3], [4]]),
+        ("window", lambda p: p.window(3), [(0, 1, 2), (1, 2, 3), (2, 3, 4)]),
+        ("window_step", lambda p: p.window(2, 2), [(0, 1), (2, 3)]),
+        ("chain", lambda p: p.map(lambda x: x + 1).filter(
+            lambda x: x > 2).batch(2), [[3, 4], [5]]),
+    ])
+    def test_stages(self, _, build, expected):
+        """
+        Test the output of each stage kind and of a chain.
+        """
+        pipeline = build(Pipeline(count_up(5)))
+        self.assertEqual(asyncio.run(pipeline.collect()), expected)
+
+    def test_concurrent_map_and_flush(self):
+        """
+        Test that a concurrent async map overlaps its calls, and that the
+        batch stage after it still flushes its last batch once every worker
+        has seen the end of the stream.
+        """
+        running = []
+        peak = []
+
+        async def slow(value):
+            running.append(value)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return value
+
+        pipeline = Pipeline(count_up(9)).map(slow, concurrency=4).batch(4)
+        batches = asyncio.run(pipeline.collect())
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 1])
+        self.assertEqual(sorted(sum(batches, [])), list(range(9)))
+        self.assertEqual(max(peak), 4)
+
+    @parameterized.expand([
+        ("source", lambda: Pipeline(fail_after(3)).map(str)),
+        ("stage", lambda: Pipeline(count_up(5)).map(
+            lambda x: 1 // (x - 2), concurrency=2).batch(2)),
+    ])
+    def test_errors_reach_consumer(self, _, build):
+        """
+        Test that an error in the source or a stage is raised to the
+        consumer and no task is left behind.
+        """
+        async def main():
+            with self.assertRaises((KeyError, ZeroDivisionError)):
+                await build().collect()
+            await settle()
+            return len(asyncio.all_tasks())
+
+        self.assertEqual(asyncio.run(main()), 1)
+
+    def test_backpressure_and_early_exit(self):
+        """
+        Test that a slow consumer holds the producer back to the queue
+        capacities, and that stopping early closes the endless source.
+        """
+        produced = []
+
+        async def main():
+            seen = 0
+            async for _ in Pipeline(count_up(None, produced),
+                                    maxsize=2).map(str):
+                await asyncio.sleep(0.001)
+                seen += 1
+                if seen == 20:
+                    break
+            await settle()
+            return len(asyncio.all_tasks())
+
+        self.assertEqual(asyncio.run(main()), 1)
+        self.assertLessEqual(len(produced), 20 + 2 * 2 + 2)
+
+    @parameterized.expand([
+        ("maxsize", lambda: Pipeline(count_up(1), maxsize=0)),
+        ("concurrency", lambda: Pipeline(count_up(1)).map(str, 0)),
+        ("batch", lambda: Pipeline(count_up(1)).batch(0)),
+        ("window", lambda: Pipeline(count_up(1)).window(2, 0)),
+    ])
+    def test_invalid(self, _, build):
+        """
+        Test that invalid sizes are rejected.
+        """
+        with self.assertRaises(ValueError):
+            build()
+
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Streaming Reductions
+
+This module provides a set of unit tests for the reducers of the
+`4-stream_stats` module. Each reducer is checked against the exact answer
+computed from the whole list with `statistics` or `sorted`.
+"""
+
+import asyncio
+import random
+import statistics
+import unittest
+from array import array
+from unittest.mock import AsyncMock, patch
+from parameterized import parameterized
+
+stream_stats = __import__('4-stream_stats')
+comprehension = __import__('1-async_comprehension')
+
+
+async def floats(values, batch_size=None):
+    """
+    Asynchronously yield `values` one by one or in `array('d')` batches.
+    """
+    if batch_size is None:
+        for value in values:
+            yield value
+        return
+    for start in range(0, len(values), batch_size):
+        yield array('d', values[start:start + batch_size])
+
+
+class TestRunningStats(unittest.TestCase):
+    """
+    Unit tests for the `RunningStats` class.
+    """
+
+    def test_matches_statistics(self):
+        """
+        Test the running values against `statistics` over the same data.
+        """
+        rng = random.Random(0)
+        values = [rng.gauss(1e6, 3) for _ in range(10000)]
+        running = stream_stats.RunningStats()
+        for value in values:
+            running.add(value)
+        summary = running.summary()
+        self.assertEqual(summary["count"], len(values))
+        self.assertAlmostEqual(summary["mean"], statistics.mean(values))
+        self.assertAlmostEqual(summary["stdev"], statistics.stdev(values))
+        self.assertEqual(summary["min"], min(values))
+        self.assertEqual(summary["max"], max(values))
+
+    def test_empty(self):
+        """
+        Test that an empty stream summarizes to zeros.
+        """
+        self.assertEqual(stream_stats.RunningStats().summary(), {
+            "count": 0, "sum": 0.0, "mean": 0.0, "stdev": 0.0,
+            "min": 0.0, "max": 0.0,
+        })
+
+
+class TestP2Quantile(unittest.TestCase):
+    """
+    Unit tests for the `P2Quantile` class.
+    """
+
+    @parameterized.expand([
+        ("uniform", 50),
+        ("uniform", 95),
+        ("gauss", 50),
+        ("gauss", 99),
+    ])
+    def test_estimate(self, distribution, q):
+        """
+        Test that the estimate lands close to the exact percentile.
+        """
+        rng = random.Random(q)
+        draw = {"uniform": lambda: rng.uniform(0, 10),
+                "gauss": lambda: rng.gauss(0, 1)}[distribution]
+        values = [draw() for _ in range(20000)]
+        quantile = stream_stats.P2Quantile(q)
+        for value in values:
+            quantile.add(value)
+        ordered = sorted(values)
+        exact = ordered[int(q / 100 * len(ordered))]
+        spread = ordered[-1] - ordered[0]
+        self.assertLess(abs(quantile.value() - exact), 0.01 * spread)
+
+    @parameterized.expand([
+        (50, [3.0, 1.0, 2.0], 2.0),
+        (99, [3.0, 1.0, 2.0], 3.0),
+        (50, [], 0.0),
+    ])
+    def test_short_stream_is_exact(self, q, values, expected):
+        """
+        Test that up to five values give the exact nearest-rank answer.
+        """
+        quantile = stream_stats.P2Quantile(q)
+        for value in values:
+            quantile.add(value)
+        self.assertEqual(quantile.value(), expected)
+
+    @parameterized.expand([(0,), (100,)])
+    def test_bounds(self, q):
+        """
+        Test that `q` must be strictly between 0 and 100.
+        """
+        with self.assertRaises(ValueError):
+            stream_stats.P2Quantile(q)
+
+
+class TestWindowStats(unittest.TestCase):
+    """
+    Unit tests for the `WindowStats` class.
+    """
+
+    @parameterized.expand([(1,), (3,), (50,)])
+    def test_matches_last_values(self, size):
+        """
+        Test the window against the last `size` values after every add.
+        """
+        rng = random.Random(size)
+        window = stream_stats.WindowStats(size)
+        values = []
+        for _ in range(200):
+            values.append(rng.uniform(-5, 5))
+            window.add(values[-1])
+            last = values[-size:]
+            summary = window.summary()
+            self.assertEqual(summary["length"], len(last))
+            self.assertAlmostEqual(summary["mean"], statistics.mean(last))
+            self.assertEqual(summary["min"], min(last))
+            self.assertEqual(summary["max"], max(last))
+
+
+class TestSummaries(unittest.TestCase):
+    """
+    Unit tests for `summarize` and `iter_summaries`.
+    """
+
+    values = [float(value) for value in range(1, 26)]
+
+    @parameterized.expand([(None,), (4,)])
+    def test_summarize(self, batch_size):
+        """
+        Test that single floats and batches summarize alike.
+        """
+        summary = asyncio.run(stream_stats.summarize(
+            floats(self.values, batch_size), (50,), window=5))
+        self.assertEqual(summary["count"], 25)
+        self.assertEqual(summary["sum"], sum(self.values))
+        self.assertEqual(summary["p50"], 13.0)
+        self.assertEqual(summary["window"]["mean"], 23.0)
+
+    @parameterized.expand([
+        (None, 10, [10, 20, 25]),
+        (None, 5, [5, 10, 15, 20, 25]),
+        (4, 10, [12, 20, 25]),
+    ])
+    def test_iter_summaries(self, batch_size, every, counts):
+        """
+        Test that a snapshot comes every `every` values and at the end,
+        never twice for the same count.
+        """
+        async def collect():
+            return [summary["count"] async for summary in
+                    stream_stats.iter_summaries(
+                        floats(self.values, batch_size), every)]
+
+        self.assertEqual(asyncio.run(collect()), counts)
+
+    def test_live_summary(self):
+        """
+        Test that a `StreamSummary` can be read while an endless stream is
+        being reduced, and keeps its values when the reduction is
+        cancelled.
+        """
+        async def endless():
+            while True:
+                yield 1.0
+                await asyncio.sleep(0)
+
+        async def main():
+            summary = stream_stats.StreamSummary()
+            task = asyncio.ensure_future(
+                stream_stats.reduce_stream(endless(), summary))
+            while summary.count < 100:
+                await asyncio.sleep(0)
+            task.cancel()
+            return summary.summary()
+
+        summary = asyncio.run(main())
+        self.assertGreaterEqual(summary["count"], 100)
+        self.assertEqual(summary["mean"], 1.0)
+
+
+class TestAsyncSummary(unittest.TestCase):
+    """
+    Unit tests for the `async_summary` and `async_summaries` functions.
+    """
+
+    def test_endless_summary_refused(self):
+        """
+        Test that `async_summary` refuses an endless stream, which it could
+        never finish.
+        """
+        with self.assertRaises(ValueError):
+            asyncio.run(comprehension.async_summary(None))
+
+    def test_endless_summaries(self):
+        """
+        Test that `async_summaries` streams snapshots of an endless stream.
+        """
+        async def main():
+            counts = []
+            async for summary in comprehension.async_summaries(
+                    every=4, batch_size=2):
+                counts.append(summary["count"])
+                if len(counts) == 2:
+                    break
+            return counts
+
+        with patch('asyncio.sleep', new=AsyncMock()):
+            self.assertEqual(asyncio.run(main()), [4, 8])
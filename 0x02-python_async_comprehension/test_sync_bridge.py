@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Sync Bridge
+
+This module provides a set of unit tests for the `LoopThread` and
+`BlockingIterator` classes and the `stream` and `run_coroutine` functions
+from the `7-sync_bridge` module. Each test uses its own `LoopThread`, so a
+failure cannot leave tasks behind on the shared loop.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import CancelledError
+from parameterized import parameterized
+
+sync_bridge = __import__('7-sync_bridge')
+BlockingIterator = sync_bridge.BlockingIterator
+LoopThread = sync_bridge.LoopThread
+
+
+async def count_up(n, produced, closed):
+    """
+    Asynchronously yield 0 to `n - 1`, or forever if `n` is None,
+    recording what was produced and whether the generator was closed.
+    """
+    value = 0
+    try:
+        while n is None or value < n:
+            produced.append(value)
+            yield value
+            value += 1
+    finally:
+        closed.set()
+
+
+def wait_until(predicate, timeout=2.0):
+    """
+    Poll `predicate` until it is true or `timeout` seconds pass.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestBlockingIterator(unittest.TestCase):
+    """
+    Unit tests for the `BlockingIterator` class.
+    """
+
+    def setUp(self):
+        """
+        Start a private loop thread.
+        """
+        self.runner = LoopThread("test-bridge")
+        self.produced = []
+        self.closed = threading.Event()
+
+    def tearDown(self):
+        """
+        Stop the private loop thread.
+        """
+        self.runner.stop()
+
+    def iterate(self, n, maxsize=16):
+        """
+        Drive `count_up(n)` on the private loop.
+        """
+        return BlockingIterator(count_up(n, self.produced, self.closed),
+                                maxsize, self.runner)
+
+    def pending_tasks(self):
+        """
+        Return the number of tasks left on the private loop.
+        """
+        loop = self.runner.loop()
+        return self.runner.submit(self.count_tasks(loop)).result(2)
+
+    @staticmethod
+    async def count_tasks(loop):
+        """
+        Count the tasks of `loop` other than the current one.
+        """
+        await asyncio.sleep(0)
+        return len(asyncio.all_tasks(loop)) - 1
+
+    def test_items_in_order(self):
+        """
+        Test that every item arrives in order and the source is closed.
+        """
+        self.assertEqual(list(self.iterate(50, 4)), list(range(50)))
+        self.assertTrue(self.closed.wait(2))
+
+    def test_bounded_buffer(self):
+        """
+        Test that the producer runs at most `maxsize` items ahead.
+        """
+        iterator = self.iterate(None, 3)
+        for _ in range(5):
+            next(iterator)
+        time.sleep(0.05)
+        self.assertLessEqual(len(self.produced), 5 + 3 + 1)
+        iterator.close()
+
+    @parameterized.expand([
+        ("break", lambda it: next(iter(it))),
+        ("close", lambda it: it.close()),
+    ])
+    def test_early_exit_cleans_up(self, _, use):
+        """
+        Test that dropping an iterator after `break`, or closing it,
+        cancels the producer and closes the source.
+        """
+        use(self.iterate(None, 2))
+        self.assertTrue(self.closed.wait(2))
+        self.assertTrue(wait_until(lambda: self.pending_tasks() == 0))
+
+    def test_close_wakes_blocked_reader(self):
+        """
+        Test that `close` from another thread wakes a blocked `__next__`.
+        """
+        async def never():
+            await asyncio.sleep(60)
+            yield None
+
+        iterator = BlockingIterator(never(), runner=self.runner)
+        results = []
+        reader = threading.Thread(target=lambda: results.append(
+            list(iterator)))
+        reader.start()
+        time.sleep(0.05)
+        iterator.close()
+        reader.join(2)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(results, [[]])
+
+    @parameterized.expand([
+        ("reading", 0.05),
+        ("just_created", 0),
+    ])
+    def test_stop_ends_blocked_reader(self, _, delay):
+        """
+        Test that stopping the loop thread ends a reader blocked in
+        `__next__` with `CancelledError` instead of hanging, including when
+        the producer had not started yet.
+        """
+        iterator = self.iterate(None, 2)
+        errors = []
+
+        def read():
+            try:
+                for _ in iterator:
+                    time.sleep(0.001)
+            except CancelledError as error:
+                errors.append(error)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        time.sleep(delay)
+        self.runner.stop()
+        reader.join(2)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(len(errors), 1)
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_source_error(self):
+        """
+        Test that an error from the source is raised by `__next__`.
+        """
+        async def fail():
+            yield 1
+            raise KeyError("source")
+
+        iterator = BlockingIterator(fail(), runner=self.runner)
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(KeyError):
+            next(iterator)
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_maxsize(self):
+        """
+        Test that `maxsize` must be at least 1.
+        """
+        with self.assertRaises(ValueError):
+            self.iterate(1, 0)
+
+
+class TestLoopThread(unittest.TestCase):
+    """
+    Unit tests for the `LoopThread` class and the shared-loop helpers.
+    """
+
+    def test_reuses_and_restarts(self):
+        """
+        Test that the loop is reused between calls and restarted after
+        `stop`.
+        """
+        runner = LoopThread("test-restart")
+        first = runner.loop()
+        self.assertIs(runner.loop(), first)
+        self.assertEqual(runner.submit(asyncio.sleep(0, "ok")).result(2),
+                         "ok")
+        runner.stop()
+        self.assertTrue(first.is_closed())
+        self.assertIsNot(runner.loop(), first)
+        runner.stop()
+
+    def test_shared_helpers(self):
+        """
+        Test `stream` and `run_coroutine` on the shared loop, from several
+        threads at once.
+        """
+        counts = []
+        threads = [
+            threading.Thread(target=lambda: counts.append(
+                len(list(sync_bridge.stream(20, 0)))))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(counts, [20] * 4)
+        self.assertEqual(
+            sync_bridge.run_coroutine(asyncio.sleep(0, "done"), 2), "done")
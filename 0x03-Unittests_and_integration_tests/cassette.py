@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Record and replay of get_json traffic.
+"""
+import gzip
+import json
+import os
+import time
+from collections import defaultdict, deque
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+)
+from unittest.mock import patch
+
+import requests
+
+from utils import BREAKER_TIMEOUT, CircuitBreaker, _get, _get_checked
+
+__all__ = [
+    "Cassette",
+    "CassetteMiss",
+]
+
+
+class CassetteMiss(KeyError):
+    """Raised when a replaying cassette has no response left for a URL.
+    """
+
+
+class Cassette:
+    """Drop-in `get_json` that records to or replays from a file.
+    In "record" mode every request goes to the network and the status,
+    headers, body and latency are kept; `save` (or leaving the `with`
+    block) writes them to a gzipped JSON file. In "replay" mode the file
+    is loaded and each URL gets its recorded responses back in order,
+    optionally sleeping for the recorded latency.
+    Example
+    -------
+    >>> with Cassette("google.json.gz", mode="record") as cassette:
+    ...     with cassette.patch():
+    ...         GithubOrgClient("google").public_repos()
+    >>> with Cassette("google.json.gz").patch():
+    ...     GithubOrgClient("google").public_repos()
+    """
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        latency: bool = False,
+    ) -> None:
+        """Init method of Cassette"""
+        if mode not in ("record", "replay"):
+            raise ValueError("unknown mode: {}".format(mode))
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.interactions: List[Dict[str, Any]] = []
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = {}
+        if mode == "replay":
+            self.load()
+
+    def __enter__(self) -> "Cassette":
+        """Use the cassette as a context manager"""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Save a recording cassette"""
+        if self.mode == "record":
+            self.save()
+
+    def get_json(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> Dict:
+        """Get JSON for `url`, recording or replaying it
+        Like `utils.get_json`, the call goes through `breaker` when one is
+        given: `timeout` defaults to `BREAKER_TIMEOUT`, and HTTP error
+        statuses, recorded or replayed, count as failures, as does a
+        replayed miss.
+        """
+        if breaker is not None:
+            if timeout is None:
+                timeout = BREAKER_TIMEOUT
+            return breaker.call(self._get_json, url, timeout, True)
+        return self._get_json(url, timeout, False)
+
+    def _get_json(
+        self,
+        url: str,
+        timeout: Optional[float],
+        check: bool,
+    ) -> Dict:
+        """Record or replay `url` depending on the mode, raising on HTTP
+        error statuses if `check` is set
+        """
+        if self.mode == "record":
+            return self._record(url, timeout, check)
+        return self._replay(url, check)
+
+    def patch(self, target: str = "client.get_json") -> Any:
+        """Patch `target` with this cassette's `get_json`"""
+        return patch(target, self.get_json)
+
+    def _record(
+        self,
+        url: str,
+        timeout: Optional[float],
+        check: bool,
+    ) -> Dict:
+        """Fetch `url` from the network and keep the interaction"""
+        start = time.perf_counter()
+        response = (_get_checked if check else _get)(url, timeout)
+        body = response.json()
+        self.interactions.append({
+            "url": url,
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "elapsed": time.perf_counter() - start,
+            "body": body,
+        })
+        return body
+
+    def _replay(self, url: str, check: bool) -> Dict:
+        """Return the next recorded body for `url`"""
+        queue = self._queues.get(url)
+        if not queue:
+            raise CassetteMiss(url)
+        interaction = queue.popleft()
+        if self.latency:
+            time.sleep(interaction["elapsed"])
+        if check and interaction["status"] >= 400:
+            raise requests.HTTPError(
+                "{} Error for url: {}".format(interaction["status"], url)
+            )
+        return interaction["body"]
+
+    def rewind(self) -> None:
+        """Start replaying from the first recorded interaction again"""
+        queues: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for interaction in self.interactions:
+            queues[interaction["url"]].append(interaction)
+        self._queues = dict(queues)
+
+    def load(self) -> None:
+        """Load the interactions recorded at `path`"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != self.VERSION:
+            raise ValueError(
+                "unsupported cassette version: {}".format(data.get("version"))
+            )
+        self.interactions = data["interactions"]
+        self.rewind()
+
+    def save(self) -> None:
+        """Write the recorded interactions to `path`"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {"version": self.VERSION, "interactions": self.interactions}
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
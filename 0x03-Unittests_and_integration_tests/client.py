@@ -2,14 +2,19 @@
 """A github org client
 """
 from typing import (
+    Any,
     List,
     Dict,
+    Mapping,
+    Sequence,
 )
 
 from utils import (
+    CircuitBreaker,
     get_json,
     access_nested_map,
     memoize,
+    project_nested_map,
 )
 
 
@@ -17,15 +22,40 @@ class GithubOrgClient:
     """A Githib org client
     """
     ORG_URL = "https://api.github.com/orgs/{org}"
+    REPO_FIELDS = (("name",), ("license", "key"))
+    REPO_COLUMNS = {"name": ("name",), "license": ("license", "key")}
 
-    def __init__(self, org_name: str) -> None:
-        """Init method of GithubOrgClient"""
+    def __init__(
+        self,
+        org_name: str,
+        repo_fields: Sequence[Sequence[str]] = None,
+        breaker: CircuitBreaker = None,
+        timeout: float = None,
+    ) -> None:
+        """Init method of GithubOrgClient
+
+        When `repo_fields` is given, each repo is reduced to those key
+        paths as soon as it is fetched and the raw payload is dropped.
+        `REPO_FIELDS` holds what `public_repos` needs.
+        Requests go through `breaker` when one is given, and give up
+        after `timeout` seconds (with a breaker, `BREAKER_TIMEOUT` from
+        utils by default).
+        """
         self._org_name = org_name
+        self._repo_fields = repo_fields
+        self._breaker = breaker
+        self._timeout = timeout
+
+    def _get_json(self, url: str) -> Dict:
+        """get_json, through the circuit breaker if there is one"""
+        if self._breaker is None and self._timeout is None:
+            return get_json(url)
+        return get_json(url, self._timeout, self._breaker)
 
     @memoize
     def org(self) -> Dict:
         """Memoize org"""
-        return get_json(self.ORG_URL.format(org=self._org_name))
+        return self._get_json(self.ORG_URL.format(org=self._org_name))
 
     @property
     def _public_repos_url(self) -> str:
@@ -35,7 +65,12 @@ class GithubOrgClient:
     @memoize
     def repos_payload(self) -> Dict:
         """Memoize repos payload"""
-        return get_json(self._public_repos_url)
+        payload = self._get_json(self._public_repos_url)
+        if self._repo_fields is None:
+            return payload
+        return [
+            project_nested_map(repo, self._repo_fields) for repo in payload
+        ]
 
     def public_repos(self, license: str = None) -> List[str]:
         """Public repos"""
@@ -47,6 +82,46 @@ class GithubOrgClient:
 
         return public_repos
 
+    def repos_table(self, columns: Mapping[str, Sequence[str]] = None) -> Any:
+        """Public repos as a `pyarrow.Table`
+
+        Each column is filled from a key path in a single pass over the
+        payload; missing paths become nulls. The table converts to
+        pandas with `to_pandas` or to Polars with `polars.from_arrow`;
+        string columns are copied by `to_pandas`. pyarrow is only
+        imported here, so it stays optional.
+        """
+        import pyarrow
+
+        columns = self.REPO_COLUMNS if columns is None else columns
+        values = {name: [] for name in columns}
+        for repo in self.repos_payload:
+            for name, path in columns.items():
+                try:
+                    value = access_nested_map(repo, path)
+                except KeyError:
+                    value = None
+                values[name].append(value)
+
+        return pyarrow.table(values)
+
+    def write_repos(
+        self,
+        path: str,
+        file_format: str = "parquet",
+        columns: Mapping[str, Sequence[str]] = None,
+    ) -> None:
+        """Write `repos_table` to a Parquet or Feather file"""
+        table = self.repos_table(columns)
+        if file_format == "parquet":
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table, path)
+        elif file_format == "feather":
+            import pyarrow.feather
+            pyarrow.feather.write_feather(table, path)
+        else:
+            raise ValueError("unknown format: {}".format(file_format))
+
     @staticmethod
     def has_license(repo: Dict[str, Dict], license_key: str) -> bool:
         """Static: has_license"""
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""License report across many github orgs
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+)
+
+from utils import access_nested_map
+
+__all__ = [
+    "license_report",
+    "org_license_report",
+]
+
+
+def org_license_report(
+    org_name: str,
+    repos: Sequence[Mapping],
+    license_keys: Iterable[str] = None,
+) -> Tuple[str, Dict[str, List[str]]]:
+    """Group the repos of one org by license key.
+    A repo is listed under a key exactly when
+    `GithubOrgClient.has_license(repo, key)` is true, so repos without
+    a license are left out.
+    Example
+    -------
+    >>> org_license_report("o", [{"name": "r", "license": {"key": "mit"}}])
+    ('o', {'mit': ['r']})
+    """
+    wanted = None if license_keys is None else set(license_keys)
+    report: Dict[str, List[str]] = {}
+    for repo in repos:
+        try:
+            key = access_nested_map(repo, ("license", "key"))
+        except KeyError:
+            continue
+        if key is None or (wanted is not None and key not in wanted):
+            continue
+        report.setdefault(key, []).append(repo["name"])
+
+    return org_name, report
+
+
+def _org_license_report(args: Tuple) -> Tuple[str, Dict[str, List[str]]]:
+    """Unpack arguments for `ProcessPoolExecutor.map`"""
+    return org_license_report(*args)
+
+
+def license_report(
+    payloads: Mapping[str, Sequence[Mapping]],
+    license_keys: Iterable[str] = None,
+    max_workers: int = None,
+) -> Dict[str, Dict]:
+    """Count and list repos per license key across many orgs.
+    `payloads` maps org names to their cached repos payload (e.g.
+    `GithubOrgClient.repos_payload`). Orgs are reported on in a process
+    pool of `max_workers` processes; `max_workers=1` stays in-process.
+    Repos are listed as "org/name", in org order.
+    Example
+    -------
+    >>> license_report({"o": [{"name": "r", "license": {"key": "mit"}}]},
+    ...                max_workers=1)
+    {'mit': {'count': 1, 'repos': ['o/r']}}
+    """
+    keys = None if license_keys is None else tuple(license_keys)
+    jobs = [(org, repos, keys) for org, repos in payloads.items()]
+    if max_workers == 1:
+        reports = map(_org_license_report, jobs)
+        return _merge_reports(reports)
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers) as executor:
+        reports = executor.map(_org_license_report, jobs, chunksize=chunksize)
+        return _merge_reports(reports)
+
+
+def _merge_reports(
+    reports: Iterable[Tuple[str, Dict[str, List[str]]]]
+) -> Dict[str, Dict]:
+    """Merge per-org reports into per-license counts and listings"""
+    merged: Dict[str, Dict] = {}
+    for org_name, report in reports:
+        for key, names in report.items():
+            entry = merged.setdefault(key, {"count": 0, "repos": []})
+            entry["count"] += len(names)
+            entry["repos"].extend(
+                "{}/{}".format(org_name, name) for name in names
+            )
+
+    return {key: merged[key] for key in sorted(merged)}
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="License report over cached github org repos payloads."
+    )
+    parser.add_argument(
+        "payloads", nargs="+",
+        help="JSON files mapping org names to repos payloads",
+    )
+    parser.add_argument(
+        "-l", "--license", action="append", dest="license_keys",
+        help="only report this license key (repeatable)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="number of worker processes (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
+
+    payloads: Dict[str, Sequence[Mapping]] = {}
+    for path in args.payloads:
+        with open(path) as f:
+            payloads.update(json.load(f))
+
+    report = license_report(payloads, args.license_keys, args.jobs)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the Cassette Class
+
+This module provides a set of unit tests for the `Cassette` class from the
+`cassette` module, which records `get_json` responses to a file and replays
+them without network access. `requests.get` is patched so that recording
+never touches the network either.
+"""
+
+import os
+import tempfile
+import unittest
+import requests
+from unittest.mock import patch, Mock
+from parameterized import parameterized
+from cassette import Cassette, CassetteMiss
+from utils import BREAKER_TIMEOUT, CircuitBreaker, CircuitOpenError
+
+
+def fake_response(payload):
+    """
+    Build a mocked `requests` response carrying `payload`.
+    """
+    return Mock(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        **{"json.return_value": payload}
+    )
+
+
+class TestCassette(unittest.TestCase):
+    """
+    Unit tests for recording and replaying with `Cassette`.
+    """
+
+    def setUp(self):
+        """
+        Record two responses for one URL and one for another.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cassette.json.gz")
+        responses = [
+            fake_response({"page": 1}),
+            fake_response({"page": 2}),
+            fake_response({"login": "google"}),
+        ]
+        with patch("requests.get", side_effect=responses):
+            with Cassette(self.path, mode="record") as cassette:
+                cassette.get_json("http://example.com/repos")
+                cassette.get_json("http://example.com/repos", timeout=2.0)
+                cassette.get_json("http://example.com/org")
+
+    def tearDown(self):
+        """
+        Remove the cassette file.
+        """
+        self.tmp.cleanup()
+
+    def test_replay(self):
+        """
+        Tests that responses come back per URL in recorded order, with
+        headers and status kept, and without calling `requests.get`.
+        """
+        with patch("requests.get") as mock_get:
+            cassette = Cassette(self.path)
+            self.assertEqual(cassette.get_json("http://example.com/org"),
+                             {"login": "google"})
+            self.assertEqual(cassette.get_json("http://example.com/repos"),
+                             {"page": 1})
+            self.assertEqual(cassette.get_json("http://example.com/repos"),
+                             {"page": 2})
+            mock_get.assert_not_called()
+        interaction = cassette.interactions[0]
+        self.assertEqual(interaction["status"], 200)
+        self.assertEqual(interaction["headers"],
+                         {"Content-Type": "application/json"})
+
+    def test_miss_and_rewind(self):
+        """
+        Tests that an exhausted or unknown URL raises `CassetteMiss` and
+        that `rewind` starts over.
+        """
+        cassette = Cassette(self.path)
+        cassette.get_json("http://example.com/org")
+        with self.assertRaises(CassetteMiss):
+            cassette.get_json("http://example.com/org")
+        with self.assertRaises(CassetteMiss):
+            cassette.get_json("http://example.com/other")
+        cassette.rewind()
+        self.assertEqual(cassette.get_json("http://example.com/org"),
+                         {"login": "google"})
+
+    @parameterized.expand([
+        (False, 0),
+        (True, 1),
+    ])
+    def test_latency(self, latency, sleeps):
+        """
+        Tests that recorded latency is only replayed when asked for.
+        """
+        cassette = Cassette(self.path, latency=latency)
+        with patch("time.sleep") as mock_sleep:
+            cassette.get_json("http://example.com/org")
+        self.assertEqual(mock_sleep.call_count, sleeps)
+
+    def test_breaker(self):
+        """
+        Tests that calls with a breaker go through it and that misses count
+        as failures.
+        """
+        breaker = CircuitBreaker(min_calls=3, failure_rate=0.6)
+        cassette = Cassette(self.path)
+        self.assertEqual(
+            cassette.get_json("http://example.com/org", breaker=breaker),
+            {"login": "google"},
+        )
+        for _ in range(2):
+            with self.assertRaises(CassetteMiss):
+                cassette.get_json("http://example.com/org", 1.0, breaker)
+        with self.assertRaises(CircuitOpenError):
+            cassette.get_json("http://example.com/repos", breaker=breaker)
+
+    def test_record_with_breaker(self):
+        """
+        Tests that recording through a breaker uses `BREAKER_TIMEOUT` and
+        counts HTTP error statuses as failures without recording them.
+        """
+        error = fake_response({"message": "Server Error"})
+        error.status_code = 500
+        error.raise_for_status.side_effect = requests.HTTPError("500")
+        breaker = CircuitBreaker(min_calls=2, failure_rate=0.5)
+        cassette = Cassette(self.path, mode="record")
+        with patch("requests.get",
+                   side_effect=[fake_response({"ok": 1}), error]) as get:
+            self.assertEqual(
+                cassette.get_json("http://example.com/a", breaker=breaker),
+                {"ok": 1},
+            )
+            with self.assertRaises(requests.HTTPError):
+                cassette.get_json("http://example.com/b", breaker=breaker)
+            with self.assertRaises(CircuitOpenError):
+                cassette.get_json("http://example.com/c", breaker=breaker)
+        get.assert_called_with("http://example.com/b",
+                               timeout=BREAKER_TIMEOUT)
+        self.assertEqual([i["url"] for i in cassette.interactions],
+                         ["http://example.com/a"])
+
+    def test_replay_error_with_breaker(self):
+        """
+        Tests that a recorded HTTP error status is only raised when
+        replaying through a breaker.
+        """
+        error = fake_response({"message": "Not Found"})
+        error.status_code = 404
+        with patch("requests.get", return_value=error):
+            with Cassette(self.path, mode="record") as cassette:
+                cassette.get_json("http://example.com/gone")
+                cassette.get_json("http://example.com/gone")
+        cassette = Cassette(self.path)
+        self.assertEqual(cassette.get_json("http://example.com/gone"),
+                         {"message": "Not Found"})
+        with self.assertRaises(requests.HTTPError):
+            cassette.get_json("http://example.com/gone",
+                              breaker=CircuitBreaker())
+
+    def test_unknown_mode(self):
+        """
+        Tests that an unknown mode is rejected.
+        """
+        with self.assertRaises(ValueError):
+            Cassette(self.path, mode="stream")
@@ -15,13 +15,23 @@ like network calls to the GitHub API, allowing tests to run without actual
 network access.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, PropertyMock, Mock
 from parameterized import parameterized, parameterized_class
+from cassette import Cassette
 from client import GithubOrgClient
+from utils import CircuitBreaker
 from fixtures import TEST_PAYLOAD
 from requests.exceptions import HTTPError
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 
 class TestGithubOrgClient(unittest.TestCase):
     """
@@ -67,6 +77,23 @@ class TestGithubOrgClient(unittest.TestCase):
         self.assertEqual(organisation, expected)
         mock_get_json.assert_called_once_with(url)
 
+    @parameterized.expand([
+        ({}, ()),
+        ({"timeout": 3.0}, (3.0, None)),
+        ({"breaker": "breaker"}, (None, "breaker")),
+    ])
+    @patch('client.get_json')
+    def test_org_timeout_and_breaker(self, kwargs, extra, mock_get_json):
+        """
+        Test that `GithubOrgClient` passes its timeout and breaker on to
+        `get_json`.
+        """
+        client = GithubOrgClient("google", **kwargs)
+        client.org
+        mock_get_json.assert_called_once_with(
+            client.ORG_URL.format(org="google"), *extra
+        )
+
     def test_public_repos_url(self):
         """
         Test the `_public_repos_url` property of `GithubOrgClient`.
@@ -271,6 +298,62 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
             self.apache2_repos,
         )
 
+    def test_public_repos_with_projection(self) -> None:
+        """
+        Test `public_repos` on a client that only keeps `REPO_FIELDS`.
+
+        This test checks that the projected payload gives the same results
+        as the raw one and that nothing beyond the projected fields is
+        retained.
+        """
+        client = GithubOrgClient(
+            "google", repo_fields=GithubOrgClient.REPO_FIELDS
+        )
+        self.assertEqual(client.public_repos(), self.expected_repos)
+        self.assertEqual(
+            client.public_repos(license="apache-2.0"),
+            self.apache2_repos,
+        )
+        for repo in client.repos_payload:
+            self.assertLessEqual(set(repo), {"name", "license"})
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_repos_table(self) -> None:
+        """
+        Test the `repos_table` method of `GithubOrgClient`.
+
+        This test checks that the Arrow table carries the repository names
+        and license keys, with nulls for repositories without a license.
+        """
+        table = GithubOrgClient("google").repos_table()
+        self.assertEqual(table.column_names, ["name", "license"])
+        self.assertEqual(table.column("name").to_pylist(),
+                         self.expected_repos)
+        licenses = table.column("license").to_pylist()
+        self.assertEqual(
+            [name for name, key in zip(self.expected_repos, licenses)
+             if key == "apache-2.0"],
+            self.apache2_repos,
+        )
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_write_repos(self) -> None:
+        """
+        Test the `write_repos` method of `GithubOrgClient`.
+
+        This test checks that a Parquet file written by `write_repos` reads
+        back to the same table, and that unknown formats are rejected.
+        """
+        client = GithubOrgClient("google")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "repos.parquet")
+            client.write_repos(path)
+            self.assertTrue(
+                pyarrow.parquet.read_table(path).equals(client.repos_table())
+            )
+            with self.assertRaises(ValueError):
+                client.write_repos(path, file_format="csv")
+
     @classmethod
     def tearDownClass(cls) -> None:
         """
@@ -278,3 +361,74 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
         `requests.get`.
         """
         cls.get_patcher.stop()
+
+
+class TestReplayGithubOrgClient(unittest.TestCase):
+    """
+    Integration tests for `GithubOrgClient` replayed from a cassette.
+
+    The cassette is recorded once from the `TEST_PAYLOAD` fixture and then
+    replayed with `requests.get` unavailable, the same way recorded
+    production traffic is replayed offline.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Record the org and repos responses of the fixture to a cassette.
+        """
+        org_payload, repos_payload, cls.expected_repos, cls.apache2_repos = (
+            TEST_PAYLOAD[0]
+        )
+        responses = {
+            'https://api.github.com/orgs/google': org_payload,
+            'https://api.github.com/orgs/google/repos': repos_payload,
+        }
+
+        def get_payload(url):
+            return Mock(status_code=200, headers={},
+                        **{'json.return_value': responses[url]})
+
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "google.json.gz")
+        with patch("requests.get", side_effect=get_payload):
+            with Cassette(cls.path, mode="record") as cassette:
+                with cassette.patch():
+                    GithubOrgClient("google").public_repos()
+
+    def test_public_repos(self) -> None:
+        """
+        Test `public_repos` with and without a license filter on replayed
+        responses.
+        """
+        with patch("requests.get", side_effect=HTTPError):
+            with Cassette(self.path).patch():
+                client = GithubOrgClient("google")
+                self.assertEqual(client.public_repos(), self.expected_repos)
+                self.assertEqual(
+                    client.public_repos(license="apache-2.0"),
+                    self.apache2_repos,
+                )
+
+    def test_public_repos_with_breaker(self) -> None:
+        """
+        Test that a client with a circuit breaker replays from the cassette
+        through the breaker.
+        """
+        breaker = CircuitBreaker()
+        with patch("requests.get", side_effect=HTTPError):
+            with Cassette(self.path).patch():
+                with patch.object(breaker, "call",
+                                  wraps=breaker.call) as mock_call:
+                    client = GithubOrgClient("google", breaker=breaker)
+                    self.assertEqual(client.public_repos(),
+                                     self.expected_repos)
+        self.assertEqual(mock_call.call_count, 2)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Remove the recorded cassette.
+        """
+        cls.tmp.cleanup()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+Unit Testing for the License Report
+
+This module provides a set of unit tests for the `report` module, which
+groups the cached repos payloads of many organisations by license key.
+The expected results are derived from `GithubOrgClient.public_repos` so
+that the report keeps the same license semantics as the client.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+from client import GithubOrgClient
+from fixtures import TEST_PAYLOAD
+from report import license_report, main, org_license_report
+
+
+class TestLicenseReport(unittest.TestCase):
+    """
+    Unit tests for `org_license_report` and `license_report`.
+    """
+
+    repos_payload = TEST_PAYLOAD[0][1]
+    apache2_repos = TEST_PAYLOAD[0][3]
+
+    def test_org_license_report(self):
+        """
+        Test that `org_license_report` agrees with `has_license`.
+
+        Asserts:
+            - Every listed repo has the license it is listed under.
+            - The apache-2.0 listing matches the fixture.
+        """
+        org, report = org_license_report("google", self.repos_payload)
+        self.assertEqual(org, "google")
+        self.assertEqual(report["apache-2.0"], self.apache2_repos)
+        for key, names in report.items():
+            for repo in self.repos_payload:
+                self.assertEqual(
+                    repo["name"] in names,
+                    GithubOrgClient.has_license(repo, key),
+                )
+
+    def test_org_license_report_filter(self):
+        """
+        Test that `license_keys` restricts the report.
+        """
+        _, report = org_license_report(
+            "google", self.repos_payload, ["apache-2.0"]
+        )
+        self.assertEqual(report, {"apache-2.0": self.apache2_repos})
+
+    @parameterized.expand([
+        ("in_process", 1),
+        ("process_pool", 2),
+    ])
+    def test_license_report(self, _, max_workers):
+        """
+        Test that `license_report` merges the reports of several orgs.
+
+        Args:
+            max_workers (int): The number of worker processes.
+
+        Asserts:
+            - Counts add up across orgs.
+            - Listings are prefixed with the org name, in org order.
+        """
+        payloads = {
+            "google": self.repos_payload,
+            "mirror": self.repos_payload,
+        }
+        report = license_report(payloads, max_workers=max_workers)
+        self.assertEqual(list(report), sorted(report))
+        self.assertEqual(
+            report["apache-2.0"],
+            {
+                "count": 2 * len(self.apache2_repos),
+                "repos": ["google/" + name for name in self.apache2_repos]
+                + ["mirror/" + name for name in self.apache2_repos],
+            },
+        )
+
+    def test_main(self):
+        """
+        Test the command line entry point on a payload file.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "payloads.json")
+            with open(path, "w") as f:
+                json.dump({"google": self.repos_payload}, f)
+            with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+                status = main([path, "-l", "apache-2.0", "-j", "1"])
+
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            json.loads(stdout.getvalue()),
+            {
+                "apache-2.0": {
+                    "count": len(self.apache2_repos),
+                    "repos": ["google/" + name for name in self.apache2_repos],
+                },
+            },
+        )
@@ -9,11 +9,19 @@ of nested dictionary access. The `parameterized` library is used to run the
 same test function with different sets of input data.
 """
 
+import threading
 import unittest
 import requests
 from unittest.mock import patch
 from parameterized import parameterized
-from utils import access_nested_map, get_json, memoize
+from utils import (
+    CircuitBreaker,
+    CircuitOpenError,
+    access_nested_map,
+    get_json,
+    memoize,
+    project_nested_map,
+)
 
 
 class TestAccessNestedMap(unittest.TestCase):
@@ -66,6 +74,37 @@ class TestAccessNestedMap(unittest.TestCase):
             access_nested_map(nested_map, path)
 
 
+class TestProjectNestedMap(unittest.TestCase):
+    """
+    Unit tests for the `project_nested_map` function.
+
+    The `test_project_nested_map` method is parameterized to test that only
+    the requested paths are kept and that missing paths are skipped.
+    """
+    @parameterized.expand([
+        ({"a": 1, "b": 2}, [("a",)], {"a": 1}),
+        ({"a": {"b": 2, "c": 3}}, [("a", "b")], {"a": {"b": 2}}),
+        ({"a": {"b": 2}, "d": 4}, [("a", "b"), ("d",)],
+         {"a": {"b": 2}, "d": 4}),
+        ({"a": None}, [("a", "b")], {}),
+        ({}, [("a",)], {}),
+    ])
+    def test_project_nested_map(self, nested_map, paths, expected):
+        """
+        Tests the `project_nested_map` function with different paths.
+
+        Args:
+            nested_map: The nested dictionary to project.
+            paths: The key paths to keep.
+            expected: The expected projection.
+
+        Asserts:
+            The result of `project_nested_map(nested_map, paths)` equals
+            the expected projection.
+        """
+        self.assertEqual(project_nested_map(nested_map, paths), expected)
+
+
 class TestGetJson(unittest.TestCase):
     """
     Unit tests for the `get_json` function.
@@ -138,3 +177,180 @@ class TestMemoize(unittest.TestCase):
             self.assertEqual(result2, 42)
 
             mock_method.assert_called_once()
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """
+    Unit tests for the `CircuitBreaker` class.
+
+    A fake clock drives the breaker so that latencies and the reset
+    timeout are deterministic.
+    """
+
+    def setUp(self):
+        """
+        Create a breaker on a fake clock that opens at a 50% failure rate
+        over at least four calls.
+        """
+        self.now = 0.0
+        self.breaker = CircuitBreaker(
+            failure_rate=0.5,
+            slow_call_duration=1.0,
+            window=4,
+            min_calls=4,
+            reset_timeout=10.0,
+            clock=lambda: self.now,
+        )
+
+    def failing_call(self):
+        """A call that raises."""
+        raise requests.exceptions.ConnectionError()
+
+    def slow_call(self):
+        """A call that takes two seconds on the fake clock."""
+        self.now += 2.0
+        return "slow"
+
+    def trip(self):
+        """Record two successes and two failures."""
+        for _ in range(2):
+            self.breaker.call(lambda: None)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.breaker.call(self.failing_call)
+
+    def test_opens_on_failure_rate(self):
+        """
+        Tests that the breaker opens and refuses calls without making them.
+        """
+        self.trip()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(self.failing_call)
+
+    def test_slow_calls_count_as_failures(self):
+        """
+        Tests that calls slower than `slow_call_duration` open the breaker.
+        """
+        for _ in range(2):
+            self.breaker.call(lambda: None)
+            self.assertEqual(self.breaker.call(self.slow_call), "slow")
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+    @parameterized.expand([
+        ("success", lambda: None, CircuitBreaker.CLOSED),
+        ("failure", lambda: 1 / 0, CircuitBreaker.OPEN),
+    ])
+    def test_half_open_probe(self, _, probe, expected):
+        """
+        Tests that one probe is let through after the reset timeout and
+        that its outcome decides the next state.
+        """
+        self.trip()
+        self.now += 10.0
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        try:
+            self.breaker.call(probe)
+        except ZeroDivisionError:
+            pass
+        self.assertEqual(self.breaker.state, expected)
+
+    def test_call_admitted_before_half_open_is_not_a_probe(self):
+        """
+        Tests that a call admitted while closed and finishing during the
+        half-open window neither closes the breaker nor uses up a probe.
+        """
+        def straggler():
+            self.trip()
+            self.now += 10.0
+            self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+
+        self.breaker.call(straggler)
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.breaker.call(lambda: None)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker._probes, 0)
+
+    def test_hedged_call(self):
+        """
+        Tests that a call running past the hedge delay is answered by a
+        second attempt.
+        """
+        breaker = CircuitBreaker(min_calls=1, hedge=True)
+        breaker.call(lambda: None)
+        release = threading.Event()
+        attempts = []
+
+        def fetch():
+            attempts.append(None)
+            if len(attempts) == 1:
+                release.wait(5)
+                return "first"
+            return "second"
+
+        try:
+            self.assertEqual(breaker.call(fetch), "second")
+        finally:
+            release.set()
+        self.assertEqual(len(attempts), 2)
+
+    def test_get_json_through_breaker(self):
+        """
+        Tests that `get_json` routes through the breaker and counts HTTP
+        error statuses as failures.
+        """
+        with patch('requests.get') as mock_get:
+            mock_get.return_value.raise_for_status.side_effect = (
+                requests.exceptions.HTTPError()
+            )
+            for _ in range(4):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    get_json("http://example.com", 1.0, self.breaker)
+            with self.assertRaises(CircuitOpenError):
+                get_json("http://example.com", 1.0, self.breaker)
+            self.assertEqual(mock_get.call_count, 4)
+            mock_get.assert_called_with("http://example.com", timeout=1.0)
+
+    def test_hedge_pool_is_shared(self):
+        """
+        Tests that concurrent hedged calls share one bounded pool, and that
+        calls run unhedged in the caller's thread once it is busy.
+        """
+        breaker = CircuitBreaker(min_calls=1, hedge=True, hedge_workers=2)
+        breaker.call(lambda: None)
+        executor = breaker._executor
+        release = threading.Event()
+        threads = []
+
+        def fetch():
+            threads.append(threading.current_thread().name)
+            release.wait(5)
+            return threading.current_thread().name
+
+        caller = threading.Thread(target=breaker.call, args=(fetch,))
+        caller.start()
+        try:
+            while len(threads) < 2:
+                release.wait(0.01)
+            self.assertEqual(breaker.call(lambda: "unhedged"), "unhedged")
+            self.assertEqual(threading.current_thread().name,
+                             breaker.call(threading.current_thread).name)
+        finally:
+            release.set()
+            caller.join()
+            breaker.close()
+        self.assertIs(breaker._executor, executor)
+        self.assertTrue(all(name.startswith("hedged-get")
+                            for name in threads))
+
+    @parameterized.expand([
+        (None, 10.0),
+        (2.0, 2.0),
+    ])
+    def test_get_json_breaker_timeout(self, timeout, expected):
+        """
+        Tests that requests through a breaker always get a finite timeout.
+        """
+        with patch('requests.get') as mock_get:
+            get_json("http://example.com", timeout, self.breaker)
+            mock_get.assert_called_once_with("http://example.com",
+                                             timeout=expected)
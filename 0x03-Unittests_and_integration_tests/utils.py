@@ -2,6 +2,14 @@
 """Generic utilities for github org client.
 """
 import requests
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
 from functools import wraps
 from typing import (
     Mapping,
@@ -9,12 +17,19 @@ from typing import (
     Any,
     Dict,
     Callable,
+    Iterable,
+    Optional,
+    Tuple,
 )
 
 __all__ = [
+    "BREAKER_TIMEOUT",
     "access_nested_map",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "get_json",
     "memoize",
+    "project_nested_map",
 ]
 
 
@@ -40,13 +55,283 @@ def access_nested_map(nested_map: Mapping, path: Sequence) -> Any:
     return nested_map
 
 
-def get_json(url: str) -> Dict:
+def project_nested_map(nested_map: Mapping, paths: Iterable[Sequence]) -> Dict:
+    """Copy only the values found at the given key paths.
+    Paths that are missing from `nested_map` are left out, so the
+    projection answers `access_nested_map` exactly like the original
+    for every projected path.
+    Parameters
+    ----------
+    nested_map: Mapping
+        A nested map
+    paths: Iterable[Sequence]
+        the key paths to keep
+    Example
+    -------
+    >>> nested_map = {"a": {"b": 1, "c": 2}, "d": 3}
+    >>> project_nested_map(nested_map, [("a", "b"), ("d",)])
+    {'a': {'b': 1}, 'd': 3}
+    """
+    projection: Dict = {}
+    for path in paths:
+        try:
+            value = access_nested_map(nested_map, path)
+        except KeyError:
+            continue
+        node = projection
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+
+    return projection
+
+
+BREAKER_TIMEOUT = 10.0
+
+
+def _get(url: str, timeout: Optional[float]) -> requests.Response:
+    """GET `url`, only passing `timeout` to requests when one is set.
+    """
+    if timeout is None:
+        return requests.get(url)
+    return requests.get(url, timeout=timeout)
+
+
+def _get_checked(url: str, timeout: Optional[float]) -> requests.Response:
+    """GET `url` like `_get`, raising on HTTP error statuses.
+    """
+    response = _get(url, timeout)
+    response.raise_for_status()
+    return response
+
+
+def _get_checked_json(url: str, timeout: Optional[float]) -> Dict:
+    """Get JSON from remote URL, raising on HTTP error statuses.
+    """
+    return _get_checked(url, timeout).json()
+
+
+def get_json(
+    url: str,
+    timeout: Optional[float] = None,
+    breaker: Optional["CircuitBreaker"] = None,
+) -> Dict:
     """Get JSON from remote URL.
+    With a `breaker`, the request goes through `breaker.call` and HTTP
+    error statuses count as failures. A hung request must fail for the
+    breaker to see it, so `timeout` then defaults to `BREAKER_TIMEOUT`.
     """
-    response = requests.get(url)
+    if breaker is not None:
+        if timeout is None:
+            timeout = BREAKER_TIMEOUT
+        return breaker.call(_get_checked_json, url, timeout)
+    response = _get(url, timeout)
     return response.json()
 
 
+class CircuitOpenError(Exception):
+    """Raised when an open `CircuitBreaker` refuses a call.
+    """
+
+
+class CircuitBreaker:
+    """Circuit breaker with optional hedged calls.
+    The breaker keeps the outcome of the last `window` calls. Once at
+    least `min_calls` are recorded and the share of failed or slow
+    (longer than `slow_call_duration`) calls reaches `failure_rate`, it
+    opens and refuses calls with `CircuitOpenError`. After
+    `reset_timeout` seconds it lets `half_open_calls` probes through:
+    a good probe closes it again, a bad one reopens it.
+    With `hedge=True`, a call still running after the `hedge_quantile`
+    latency of recent successful calls gets a second attempt, and the
+    first successful result wins. Attempts run on a pool of
+    `hedge_workers` threads; a losing attempt keeps its thread until it
+    returns, so the calls need a timeout of their own. When the pool is
+    busy, calls run unhedged in the caller's thread.
+    Example
+    -------
+    >>> breaker = CircuitBreaker(slow_call_duration=2.0, hedge=True)
+    >>> get_json("https://api.github.com/orgs/google", 5.0, breaker)
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        window: int = 20,
+        min_calls: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init method of CircuitBreaker"""
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque = deque(maxlen=window)
+        self._latencies: deque = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._half_opened = 0
+        self._hedge_workers = hedge_workers
+        self._attempts = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if hedge:
+            self._executor = ThreadPoolExecutor(
+                hedge_workers, thread_name_prefix="hedged-get"
+            )
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open when due"""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """State check; the caller holds the lock"""
+        if (self._state == self.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout):
+            self._state = self.HALF_OPEN
+            self._probes = 0
+            self._half_opened += 1
+        return self._state
+
+    def _open(self) -> None:
+        """Open the circuit; the caller holds the lock"""
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+    def _acquire(self) -> Tuple[str, int]:
+        """Admit a call or raise `CircuitOpenError`
+        Returns the state the call was admitted in and which half-open
+        window it belongs to.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN:
+                raise CircuitOpenError("circuit is open")
+            if state == self.HALF_OPEN:
+                if self._probes >= self.half_open_calls:
+                    raise CircuitOpenError("circuit is half-open")
+                self._probes += 1
+            return state, self._half_opened
+
+    def _record(
+        self,
+        admitted: Tuple[str, int],
+        failed: bool,
+        elapsed: float,
+    ) -> None:
+        """Record the outcome of a call admitted as `admitted`
+        Only probes of the current half-open window decide that window;
+        calls admitted before it only count once the breaker is closed.
+        """
+        slow = (self.slow_call_duration is not None
+                and elapsed >= self.slow_call_duration)
+        with self._lock:
+            if not failed:
+                self._latencies.append(elapsed)
+            bad = failed or slow
+            if self._state == self.HALF_OPEN:
+                if admitted != (self.HALF_OPEN, self._half_opened):
+                    return
+                self._probes -= 1
+                if bad:
+                    self._open()
+                else:
+                    self._state = self.CLOSED
+                    self._outcomes.clear()
+                return
+            if self._state == self.OPEN:
+                return
+            self._outcomes.append(bad)
+            calls = len(self._outcomes)
+            if (calls >= self.min_calls
+                    and sum(self._outcomes) / calls >= self.failure_rate):
+                self._open()
+
+    def hedge_delay(self) -> Optional[float]:
+        """Latency at `hedge_quantile` of recent successful calls"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_calls:
+            return None
+        index = min(len(latencies) - 1,
+                    int(self.hedge_quantile * len(latencies)))
+        return latencies[index]
+
+    def call(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Call `fn` through the breaker"""
+        admitted = self._acquire()
+        start = self._clock()
+        try:
+            if self.hedge and admitted[0] == self.CLOSED:
+                result = self._call_hedged(fn, args, kwargs)
+            else:
+                result = fn(*args, **kwargs)
+        except Exception:
+            self._record(admitted, True, self._clock() - start)
+            raise
+        self._record(admitted, False, self._clock() - start)
+        return result
+
+    def _call_hedged(self, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run `fn`, firing a second attempt after `hedge_delay`"""
+        delay = self.hedge_delay()
+        if delay is None or not self._reserve_attempts(2):
+            return fn(*args, **kwargs)
+        pending = {self._submit(fn, args, kwargs)}
+        done, pending = wait(pending, timeout=delay)
+        if not done:
+            pending.add(self._submit(fn, args, kwargs))
+        else:
+            self._release_attempt()
+        while True:
+            if not done:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            if future.exception() is None or not (done or pending):
+                return future.result()
+
+    def _reserve_attempts(self, count: int) -> bool:
+        """Claim `count` pool threads, or none if the pool is too busy"""
+        with self._lock:
+            if self._attempts + count > self._hedge_workers:
+                return False
+            self._attempts += count
+            return True
+
+    def _release_attempt(self, *_: Any) -> None:
+        """Give back a pool thread claimed by `_reserve_attempts`"""
+        with self._lock:
+            self._attempts -= 1
+
+    def _submit(self, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run one attempt on the pool, releasing its claim when done"""
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._release_attempt)
+        return future
+
+    def close(self) -> None:
+        """Shut down the hedging pool without waiting for attempts"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
 def memoize(fn: Callable) -> Callable:
     """Decorator to memoize a method.
     Example